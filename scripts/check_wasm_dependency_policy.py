@@ -21,13 +21,15 @@ import pathlib
 import re
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 TREE_LINE_RE = re.compile(r"^(\d+)(.+)$")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PolicyEntry:
     name: str
     reason: str
@@ -35,7 +37,7 @@ class PolicyEntry:
     risk_score: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Transition:
     crate: str
     status: str
@@ -45,7 +47,7 @@ class Transition:
     notes: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Profile:
     profile_id: str
     target: str
@@ -54,7 +56,7 @@ class Profile:
     features: tuple[str, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Finding:
     profile_id: str
     target: str
@@ -311,14 +313,19 @@ def run_cargo_tree(profile: Profile) -> tuple[list[str], list[str]]:
     if profile.features:
         cmd += ["--features", ",".join(profile.features)]
 
-    proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    if proc.returncode != 0:
-        stderr = proc.stderr.strip()
-        raise RuntimeError(
-            f"cargo tree failed for profile={profile.profile_id} target={profile.target}: {stderr}"
-        )
+    # Resolver chatter on stderr can be large; spool it to disk and only
+    # decode it when the command actually fails.
+    with tempfile.TemporaryFile() as stderr_file:
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=stderr_file, check=False)
+        if proc.returncode != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode("utf-8", errors="replace").strip()
+            raise RuntimeError(
+                f"cargo tree failed for profile={profile.profile_id} target={profile.target}: {stderr}"
+            )
 
-    lines = [line for line in proc.stdout.splitlines() if line.strip()]
+    stdout = proc.stdout.decode("utf-8", errors="replace")
+    lines = [line for line in stdout.splitlines() if line.strip()]
     return cmd, lines
 
 
@@ -454,7 +461,7 @@ def finding_to_json(finding: Finding) -> dict[str, Any]:
     }
 
 
-def write_ndjson(path: pathlib.Path, rows: list[dict[str, Any]]) -> None:
+def write_ndjson(path: pathlib.Path, rows: Iterable[dict[str, Any]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as handle:
         for row in rows:
@@ -723,21 +730,28 @@ def main() -> int:
         "findings": findings_json,
     }
 
-    logs = []
-    for finding in all_findings:
-        log_row = {
-            "event": "wasm_dependency_policy_finding",
-            "ts_utc": now_utc.isoformat().replace("+00:00", "Z"),
-            "audit_run_id": audit_run_id,
-            "policy_path": str(policy_path),
-            "policy_sha256": policy_sha256,
-            "policy_schema_version": policy["schema_version"],
-            **finding_to_json(finding),
-        }
-        logs.append(log_row)
-
-    write_json(summary_path, summary)
-    write_ndjson(log_path, logs)
+    ts_utc = summary["generated_at_utc"]
+
+    def log_rows() -> Iterator[dict[str, Any]]:
+        # Rows are produced lazily so the NDJSON log never materializes a
+        # second copy of every finding.
+        for finding_json in findings_json:
+            yield {
+                "event": "wasm_dependency_policy_finding",
+                "ts_utc": ts_utc,
+                "audit_run_id": audit_run_id,
+                "policy_path": str(policy_path),
+                "policy_sha256": policy_sha256,
+                "policy_schema_version": policy["schema_version"],
+                **finding_json,
+            }
+
+    # The two artifacts are independent; overlap their I/O.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        summary_write = executor.submit(write_json, summary_path, summary)
+        log_write = executor.submit(write_ndjson, log_path, log_rows())
+        summary_write.result()
+        log_write.result()
 
     if passed:
         print(
@@ -4,40 +4,65 @@
 from __future__ import annotations
 
 import argparse
-import copy
 import datetime as dt
+import functools
 import json
+import operator
+import os
 import pathlib
+import re
 import shlex
 import sys
 from dataclasses import dataclass
 from typing import Any
 
 
+POLICY_SCHEMA_VERSION = "wasm-optimization-policy-v1"
+# Top-level sections that must be JSON objects; checked in one structural pass
+# before any field-level validation runs.
+POLICY_OBJECT_SECTIONS = ("budget_contract", "invariants", "output")
+ALLOWED_VARIANTS = frozenset(("dev", "canary", "release"))
+# Summary row order; matches the historical lexicographic sort on variant.
+VARIANT_ORDER = {"canary": 0, "dev": 1, "release": 2}
+# Per-profile fields pulled out in a single C-level call once a profile is selected.
+PROFILE_FIELDS = (
+    "variant",
+    "budget_profile",
+    "cargo",
+    "rustflags",
+    "wasm_opt",
+    "artifact",
+    "tradeoff",
+)
+_get_profile_fields = operator.itemgetter(*PROFILE_FIELDS)
+# Same character set shlex.quote leaves unquoted.
+SHELL_SAFE_RE = re.compile(r"[\w@%+=:,./-]+", re.ASCII)
+
+
 class PolicyError(ValueError):
     """Raised when policy validation fails."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CargoProfile:
     release: bool
     no_default_features: bool
     features: tuple[str, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WasmOptProfile:
     enabled: bool
     passes: tuple[str, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArtifactPaths:
     source: str
     optimized: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OptimizationProfile:
     profile_id: str
     variant: str
@@ -72,12 +97,35 @@ def parse_args() -> argparse.Namespace:
         default=[],
         help="Restrict summary to one or more policy profile IDs.",
     )
+    parser.add_argument(
+        "--skip-validation",
+        action="store_true",
+        help=(
+            "Trust the policy structure and skip validation. Intended for post-commit "
+            "CI steps where the same policy was already validated upstream."
+        ),
+    )
     return parser.parse_args()
 
 
+def _is_str_list(value: Any, *, allow_empty_entries: bool = False) -> bool:
+    """Return True when value is a list whose entries are (non-empty) strings."""
+    if not isinstance(value, list):
+        return False
+    if allow_empty_entries:
+        return all(isinstance(entry, str) for entry in value)
+    return all(isinstance(entry, str) and entry for entry in value)
+
+
+def _interned(values: list[str]) -> tuple[str, ...]:
+    """Intern repeated feature/flag strings so profiles share one object each."""
+    return tuple(map(sys.intern, values))
+
+
 def load_json(path: pathlib.Path) -> dict[str, Any]:
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        # json.loads accepts UTF-8 bytes directly, skipping the intermediate str.
+        raw = json.loads(path.read_bytes())
     except FileNotFoundError as exc:
         raise PolicyError(f"policy file not found: {path}") from exc
     except json.JSONDecodeError as exc:
@@ -90,50 +138,41 @@ def load_json(path: pathlib.Path) -> dict[str, Any]:
 def parse_contract(
     policy: dict[str, Any],
 ) -> tuple[str, tuple[str, ...], frozenset[str], frozenset[str], str]:
-    if policy.get("schema_version") != "wasm-optimization-policy-v1":
+    if policy.get("schema_version") != POLICY_SCHEMA_VERSION:
         raise PolicyError("unsupported or missing schema_version")
+    for section in POLICY_OBJECT_SECTIONS:
+        if not isinstance(policy.get(section), dict):
+            raise PolicyError(f"{section} must be an object")
 
-    budget_contract = policy.get("budget_contract")
-    if not isinstance(budget_contract, dict):
-        raise PolicyError("budget_contract must be an object")
+    budget_contract = policy["budget_contract"]
     allowed_budget_profiles = budget_contract.get("allowed_budget_profiles")
-    if not isinstance(allowed_budget_profiles, list) or not all(
-        isinstance(entry, str) and entry for entry in allowed_budget_profiles
-    ):
+    if not _is_str_list(allowed_budget_profiles):
         raise PolicyError("budget_contract.allowed_budget_profiles must be a non-empty list[str]")
     allowed_budgets = frozenset(allowed_budget_profiles)
     if not allowed_budgets:
         raise PolicyError("budget_contract.allowed_budget_profiles cannot be empty")
 
-    invariants = policy.get("invariants")
-    if not isinstance(invariants, dict):
-        raise PolicyError("invariants must be an object")
+    invariants = policy["invariants"]
     target = invariants.get("target")
     if not isinstance(target, str) or not target:
         raise PolicyError("invariants.target must be a non-empty string")
 
     required_features = invariants.get("required_features")
-    if not isinstance(required_features, list) or not all(
-        isinstance(entry, str) and entry for entry in required_features
-    ):
+    if not _is_str_list(required_features):
         raise PolicyError("invariants.required_features must be a list[str]")
-    required = tuple(sorted(required_features))
+    required = tuple(sorted(_interned(required_features)))
 
     forbidden_features = invariants.get("forbidden_features")
-    if not isinstance(forbidden_features, list) or not all(
-        isinstance(entry, str) and entry for entry in forbidden_features
-    ):
+    if not _is_str_list(forbidden_features):
         raise PolicyError("invariants.forbidden_features must be a list[str]")
-    forbidden = frozenset(forbidden_features)
+    forbidden = frozenset(_interned(forbidden_features))
 
     overlap = set(required).intersection(forbidden)
     if overlap:
         overlap_csv = ", ".join(sorted(overlap))
         raise PolicyError(f"required_features and forbidden_features overlap: {overlap_csv}")
 
-    output = policy.get("output")
-    if not isinstance(output, dict):
-        raise PolicyError("output must be an object")
+    output = policy["output"]
     summary_path = output.get("summary_path")
     if not isinstance(summary_path, str) or not summary_path:
         raise PolicyError("output.summary_path must be a non-empty string")
@@ -141,18 +180,47 @@ def parse_contract(
     return target, required, forbidden, allowed_budgets, summary_path
 
 
-def parse_profiles(
-    policy: dict[str, Any],
-    required_features: tuple[str, ...],
+def check_feature_matrix(
+    profile_features: list[tuple[str, frozenset[str]]],
+    required_features: frozenset[str],
     forbidden_features: frozenset[str],
-    allowed_budgets: frozenset[str],
+) -> None:
+    """Check required/forbidden cargo features for all profiles in one pass.
+
+    Every offending profile is reported in a single PolicyError instead of
+    stopping at the first one.
+    """
+    # Sorted once so error messages are built in order without a per-profile sort.
+    sorted_required = sorted(required_features)
+    sorted_forbidden = sorted(forbidden_features)
+    problems: list[str] = []
+    for profile_id, feature_set in profile_features:
+        if not required_features <= feature_set:
+            missing_required = [feat for feat in sorted_required if feat not in feature_set]
+            problems.append(
+                f"profile {profile_id}: missing required cargo.features: "
+                f"{', '.join(missing_required)}"
+            )
+        if not forbidden_features.isdisjoint(feature_set):
+            forbidden_present = [feat for feat in sorted_forbidden if feat in feature_set]
+            problems.append(
+                f"profile {profile_id}: forbidden cargo.features present: "
+                f"{', '.join(forbidden_present)}"
+            )
+    if problems:
+        raise PolicyError("; ".join(problems))
+
+
+def select_profiles(
+    raw_profiles: list[Any],
     only_profiles: set[str],
-) -> list[OptimizationProfile]:
-    raw_profiles = policy.get("profiles")
-    if not isinstance(raw_profiles, list) or not raw_profiles:
-        raise PolicyError("profiles must be a non-empty list")
+) -> list[tuple[str, dict[str, Any]]]:
+    """Check profile identity (ids, variants) and apply --only-profile.
 
-    profiles: list[OptimizationProfile] = []
+    This is the only order-dependent part of profile validation; everything
+    after it is per-profile and independent.
+    """
+    selected: list[tuple[str, dict[str, Any]]] = []
     seen_ids: set[str] = set()
     seen_variants: set[str] = set()
 
@@ -160,9 +228,6 @@ def parse_profiles(
         if not isinstance(raw, dict):
             raise PolicyError("profiles entries must be objects")
         profile_id = raw.get("id")
-        variant = raw.get("variant")
-        budget_profile = raw.get("budget_profile")
-
         if not isinstance(profile_id, str) or not profile_id:
             raise PolicyError("profile id must be a non-empty string")
         if profile_id in seen_ids:
@@ -172,7 +237,8 @@ def parse_profiles(
         if only_profiles and profile_id not in only_profiles:
             continue
 
-        if not isinstance(variant, str) or variant not in {"dev", "canary", "release"}:
+        variant = raw.get("variant")
+        if not isinstance(variant, str) or variant not in ALLOWED_VARIANTS:
             raise PolicyError(
                 f"profile {profile_id}: variant must be one of dev|canary|release"
             )
@@ -180,91 +246,113 @@ def parse_profiles(
             raise PolicyError(f"duplicate variant detected: {variant}")
         seen_variants.add(variant)
 
-        if not isinstance(budget_profile, str) or budget_profile not in allowed_budgets:
-            raise PolicyError(
-                f"profile {profile_id}: budget_profile must be one of "
-                f"{', '.join(sorted(allowed_budgets))}"
-            )
+        selected.append((profile_id, raw))
 
-        cargo_raw = raw.get("cargo")
-        if not isinstance(cargo_raw, dict):
-            raise PolicyError(f"profile {profile_id}: cargo must be an object")
-        release = cargo_raw.get("release")
-        no_default_features = cargo_raw.get("no_default_features")
-        features = cargo_raw.get("features")
-        if not isinstance(release, bool) or not isinstance(no_default_features, bool):
-            raise PolicyError(f"profile {profile_id}: cargo.release/no_default_features must be bool")
-        if not isinstance(features, list) or not all(
-            isinstance(entry, str) and entry for entry in features
-        ):
-            raise PolicyError(f"profile {profile_id}: cargo.features must be list[str]")
-
-        feature_set = set(features)
-        missing_required = [feat for feat in required_features if feat not in feature_set]
-        if missing_required:
-            raise PolicyError(
-                f"profile {profile_id}: missing required cargo.features: "
-                f"{', '.join(sorted(missing_required))}"
-            )
-        forbidden_present = sorted(feature_set.intersection(forbidden_features))
-        if forbidden_present:
-            raise PolicyError(
-                f"profile {profile_id}: forbidden cargo.features present: "
-                f"{', '.join(forbidden_present)}"
-            )
+    return selected
 
-        rustflags_raw = raw.get("rustflags")
-        if not isinstance(rustflags_raw, list) or not all(
-            isinstance(entry, str) and entry.startswith("-C") for entry in rustflags_raw
-        ):
-            raise PolicyError(f"profile {profile_id}: rustflags must be list of -C flags")
-        rustflags = tuple(rustflags_raw)
-
-        wasm_opt_raw = raw.get("wasm_opt")
-        if not isinstance(wasm_opt_raw, dict):
-            raise PolicyError(f"profile {profile_id}: wasm_opt must be an object")
-        enabled = wasm_opt_raw.get("enabled")
-        passes = wasm_opt_raw.get("passes")
-        if not isinstance(enabled, bool):
-            raise PolicyError(f"profile {profile_id}: wasm_opt.enabled must be bool")
-        if not isinstance(passes, list) or not all(isinstance(entry, str) for entry in passes):
-            raise PolicyError(f"profile {profile_id}: wasm_opt.passes must be list[str]")
-        if enabled and not passes:
-            raise PolicyError(f"profile {profile_id}: wasm_opt.enabled=true requires passes")
-        if not enabled and passes:
-            raise PolicyError(f"profile {profile_id}: wasm_opt.enabled=false requires empty passes")
-
-        artifact_raw = raw.get("artifact")
-        if not isinstance(artifact_raw, dict):
-            raise PolicyError(f"profile {profile_id}: artifact must be an object")
-        source = artifact_raw.get("source")
-        optimized = artifact_raw.get("optimized")
-        if not isinstance(source, str) or not source:
-            raise PolicyError(f"profile {profile_id}: artifact.source must be non-empty string")
-        if not isinstance(optimized, str) or not optimized:
-            raise PolicyError(f"profile {profile_id}: artifact.optimized must be non-empty string")
-
-        tradeoff = raw.get("tradeoff")
-        if not isinstance(tradeoff, str) or not tradeoff.strip():
-            raise PolicyError(f"profile {profile_id}: tradeoff must be non-empty string")
 
-        profiles.append(
-            OptimizationProfile(
-                profile_id=profile_id,
-                variant=variant,
-                budget_profile=budget_profile,
-                cargo=CargoProfile(
-                    release=release,
-                    no_default_features=no_default_features,
-                    features=tuple(sorted(feature_set)),
-                ),
-                rustflags=rustflags,
-                wasm_opt=WasmOptProfile(enabled=enabled, passes=tuple(passes)),
-                artifact=ArtifactPaths(source=source, optimized=optimized),
-                tradeoff=tradeoff.strip(),
-            )
+def parse_profile(
+    profile_id: str,
+    raw: dict[str, Any],
+    allowed_budgets: frozenset[str],
+) -> OptimizationProfile:
+    """Validate and build a single profile already accepted by select_profiles."""
+    try:
+        (
+            variant,
+            budget_profile,
+            cargo_raw,
+            rustflags_raw,
+            wasm_opt_raw,
+            artifact_raw,
+            tradeoff,
+        ) = _get_profile_fields(raw)
+    except KeyError as exc:
+        raise PolicyError(f"profile {profile_id}: missing field {exc.args[0]}") from exc
+
+    if not isinstance(budget_profile, str) or budget_profile not in allowed_budgets:
+        raise PolicyError(
+            f"profile {profile_id}: budget_profile must be one of "
+            f"{', '.join(sorted(allowed_budgets))}"
         )
 
+    if not isinstance(cargo_raw, dict):
+        raise PolicyError(f"profile {profile_id}: cargo must be an object")
+    release = cargo_raw.get("release")
+    no_default_features = cargo_raw.get("no_default_features")
+    features = cargo_raw.get("features")
+    if not isinstance(release, bool) or not isinstance(no_default_features, bool):
+        raise PolicyError(f"profile {profile_id}: cargo.release/no_default_features must be bool")
+    if not _is_str_list(features):
+        raise PolicyError(f"profile {profile_id}: cargo.features must be list[str]")
+
+    if not isinstance(rustflags_raw, list) or not all(
+        isinstance(entry, str) and entry.startswith("-C") for entry in rustflags_raw
+    ):
+        raise PolicyError(f"profile {profile_id}: rustflags must be list of -C flags")
+
+    if not isinstance(wasm_opt_raw, dict):
+        raise PolicyError(f"profile {profile_id}: wasm_opt must be an object")
+    enabled = wasm_opt_raw.get("enabled")
+    passes = wasm_opt_raw.get("passes")
+    if not isinstance(enabled, bool):
+        raise PolicyError(f"profile {profile_id}: wasm_opt.enabled must be bool")
+    if not _is_str_list(passes, allow_empty_entries=True):
+        raise PolicyError(f"profile {profile_id}: wasm_opt.passes must be list[str]")
+    if enabled and not passes:
+        raise PolicyError(f"profile {profile_id}: wasm_opt.enabled=true requires passes")
+    if not enabled and passes:
+        raise PolicyError(f"profile {profile_id}: wasm_opt.enabled=false requires empty passes")
+
+    if not isinstance(artifact_raw, dict):
+        raise PolicyError(f"profile {profile_id}: artifact must be an object")
+    source = artifact_raw.get("source")
+    optimized = artifact_raw.get("optimized")
+    if not isinstance(source, str) or not source:
+        raise PolicyError(f"profile {profile_id}: artifact.source must be non-empty string")
+    if not isinstance(optimized, str) or not optimized:
+        raise PolicyError(f"profile {profile_id}: artifact.optimized must be non-empty string")
+
+    if not isinstance(tradeoff, str) or not tradeoff.strip():
+        raise PolicyError(f"profile {profile_id}: tradeoff must be non-empty string")
+
+    return OptimizationProfile(
+        profile_id=profile_id,
+        variant=variant,
+        budget_profile=budget_profile,
+        cargo=CargoProfile(
+            release=release,
+            no_default_features=no_default_features,
+            features=tuple(sorted(set(_interned(features)))),
+        ),
+        rustflags=_interned(rustflags_raw),
+        wasm_opt=WasmOptProfile(enabled=enabled, passes=_interned(passes)),
+        artifact=ArtifactPaths(source=source, optimized=optimized),
+        tradeoff=tradeoff.strip(),
+    )
+
+
+def parse_profiles(
+    policy: dict[str, Any],
+    required_features: tuple[str, ...],
+    forbidden_features: frozenset[str],
+    allowed_budgets: frozenset[str],
+    only_profiles: set[str],
+) -> list[OptimizationProfile]:
+    raw_profiles = policy.get("profiles")
+    if not isinstance(raw_profiles, list) or not raw_profiles:
+        raise PolicyError("profiles must be a non-empty list")
+
+    profiles = [
+        parse_profile(profile_id, raw, allowed_budgets)
+        for profile_id, raw in select_profiles(raw_profiles, only_profiles)
+    ]
+    check_feature_matrix(
+        [(profile.profile_id, frozenset(profile.cargo.features)) for profile in profiles],
+        frozenset(required_features),
+        forbidden_features,
+    )
+
     if only_profiles and not profiles:
         missing = ", ".join(sorted(only_profiles))
         raise PolicyError(f"--only-profile selected unknown profile(s): {missing}")
@@ -275,6 +363,67 @@ def parse_profiles(
     return profiles
 
 
+def load_trusted_contract(
+    policy: dict[str, Any],
+) -> tuple[str, tuple[str, ...], frozenset[str], frozenset[str], str]:
+    """Read the contract fields without validation (see --skip-validation)."""
+    invariants = policy["invariants"]
+    return (
+        invariants["target"],
+        tuple(sorted(_interned(invariants["required_features"]))),
+        frozenset(_interned(invariants["forbidden_features"])),
+        frozenset(policy["budget_contract"]["allowed_budget_profiles"]),
+        policy["output"]["summary_path"],
+    )
+
+
+def load_trusted_profiles(
+    policy: dict[str, Any],
+    only_profiles: set[str],
+) -> list[OptimizationProfile]:
+    """Construct profiles directly from trusted JSON (see --skip-validation)."""
+    profiles: list[OptimizationProfile] = []
+    for raw in policy["profiles"]:
+        if only_profiles and raw["id"] not in only_profiles:
+            continue
+        cargo_raw = raw["cargo"]
+        wasm_opt_raw = raw["wasm_opt"]
+        artifact_raw = raw["artifact"]
+        profiles.append(
+            OptimizationProfile(
+                profile_id=raw["id"],
+                variant=raw["variant"],
+                budget_profile=raw["budget_profile"],
+                cargo=CargoProfile(
+                    release=cargo_raw["release"],
+                    no_default_features=cargo_raw["no_default_features"],
+                    features=tuple(sorted(set(_interned(cargo_raw["features"])))),
+                ),
+                rustflags=_interned(raw["rustflags"]),
+                wasm_opt=WasmOptProfile(
+                    enabled=wasm_opt_raw["enabled"],
+                    passes=_interned(wasm_opt_raw["passes"]),
+                ),
+                artifact=ArtifactPaths(
+                    source=artifact_raw["source"],
+                    optimized=artifact_raw["optimized"],
+                ),
+                tradeoff=raw["tradeoff"].strip(),
+            )
+        )
+    if not profiles:
+        raise PolicyError("no profiles selected")
+    return profiles
+
+
+def shell_quote(token: str) -> str:
+    """shlex.quote with a fast path for tokens that need no quoting."""
+    if SHELL_SAFE_RE.fullmatch(token):
+        return token
+    return shlex.quote(token)
+
+
+@functools.cache
 def render_cargo_command(target: str, profile: OptimizationProfile) -> str:
     parts = ["cargo", "build", "-p", "asupersync", "--target", target]
     if profile.cargo.release:
@@ -283,18 +432,34 @@ def render_cargo_command(target: str, profile: OptimizationProfile) -> str:
         parts.append("--no-default-features")
     if profile.cargo.features:
         parts.extend(["--features", ",".join(profile.cargo.features)])
-    command = " ".join(shlex.quote(part) for part in parts)
+    command = " ".join(shell_quote(part) for part in parts)
     if profile.rustflags:
         rustflags = " ".join(profile.rustflags)
-        return f"RUSTFLAGS={shlex.quote(rustflags)} {command}"
+        return f"RUSTFLAGS={shell_quote(rustflags)} {command}"
     return command
 
 
+@functools.cache
 def render_wasm_opt_command(profile: OptimizationProfile) -> str | None:
     if not profile.wasm_opt.enabled:
         return None
     parts = ["wasm-opt", *profile.wasm_opt.passes, "-o", profile.artifact.optimized, profile.artifact.source]
-    return " ".join(shlex.quote(part) for part in parts)
+    return " ".join(shell_quote(part) for part in parts)
+
+
+def generated_at_utc() -> str:
+    """Summary timestamp, pinned by SOURCE_DATE_EPOCH for reproducible output."""
+    source_date_epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if source_date_epoch:
+        try:
+            stamp = dt.datetime.fromtimestamp(int(source_date_epoch), dt.timezone.utc)
+        except (ValueError, OverflowError, OSError) as exc:
+            raise PolicyError(
+                f"SOURCE_DATE_EPOCH must be an in-range integer Unix timestamp: {source_date_epoch}"
+            ) from exc
+    else:
+        stamp = dt.datetime.now(dt.timezone.utc)
+    return stamp.strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def build_summary(
@@ -302,44 +467,43 @@ def build_summary(
     target: str,
     profiles: list[OptimizationProfile],
 ) -> dict[str, Any]:
-    profile_rows: list[dict[str, Any]] = []
-    for profile in sorted(profiles, key=lambda item: item.variant):
-        profile_rows.append(
-            {
-                "id": profile.profile_id,
-                "variant": profile.variant,
-                "budget_profile": profile.budget_profile,
-                "cargo_command": render_cargo_command(target, profile),
-                "wasm_opt_command": render_wasm_opt_command(profile),
-                "source_artifact": profile.artifact.source,
-                "optimized_artifact": profile.artifact.optimized,
-                "tradeoff": profile.tradeoff,
-            }
-        )
+    # Keys are inserted in sorted order so write_summary can serialize without
+    # a sort_keys pass; the self-test guards this ordering.
+    profile_rows: list[dict[str, Any]] = [
+        {
+            "budget_profile": profile.budget_profile,
+            "cargo_command": render_cargo_command(target, profile),
+            "id": profile.profile_id,
+            "optimized_artifact": profile.artifact.optimized,
+            "source_artifact": profile.artifact.source,
+            "tradeoff": profile.tradeoff,
+            "variant": profile.variant,
+            "wasm_opt_command": render_wasm_opt_command(profile),
+        }
+        for profile in sorted(profiles, key=lambda item: VARIANT_ORDER[item.variant])
+    ]
 
     return {
-        "schema_version": "wasm-optimization-pipeline-summary-v1",
-        "generated_at_utc": dt.datetime.now(dt.timezone.utc)
-        .replace(microsecond=0)
-        .isoformat()
-        .replace("+00:00", "Z"),
-        "policy_path": str(policy_path),
-        "target": target,
-        "profiles": profile_rows,
-        "profile_count": len(profile_rows),
         "budget_summary_contract": "artifacts/wasm_budget_summary.json",
         "downstream_blockers": ["asupersync-umelq.13.5", "asupersync-umelq.18.5"],
+        "generated_at_utc": generated_at_utc(),
+        "policy_path": str(policy_path),
+        "profile_count": len(profile_rows),
+        "profiles": profile_rows,
+        "schema_version": "wasm-optimization-pipeline-summary-v1",
+        "target": target,
     }
 
 
 def write_summary(path: pathlib.Path, summary: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(summary, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    path.write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
 
 
-def run_self_test() -> None:
-    base_policy: dict[str, Any] = {
-        "schema_version": "wasm-optimization-policy-v1",
+def build_self_test_policy() -> dict[str, Any]:
+    """Return a fresh, minimal valid policy for self-test mutation."""
+    return {
+        "schema_version": POLICY_SCHEMA_VERSION,
         "budget_contract": {
             "source_document": "WASM_SIZE_PERF_BUDGETS.md",
             "allowed_budget_profiles": ["core-min", "full-dev"],
@@ -371,13 +535,41 @@ def run_self_test() -> None:
         "output": {"summary_path": "artifacts/test_summary.json"},
     }
 
+
+def run_self_test() -> None:
+    base_policy = build_self_test_policy()
     target, required, forbidden, allowed_budgets, _summary_path = parse_contract(base_policy)
     profiles = parse_profiles(base_policy, required, forbidden, allowed_budgets, set())
     summary = build_summary(pathlib.Path("policy.json"), target, profiles)
     assert summary["profile_count"] == 1
     assert "cargo build" in summary["profiles"][0]["cargo_command"]
-
-    bad_missing_feature = copy.deepcopy(base_policy)
+    assert json.dumps(summary, indent=2) == json.dumps(summary, indent=2, sort_keys=True), (
+        "build_summary must insert keys in sorted order"
+    )
+    assert render_cargo_command(target, profiles[0]) is render_cargo_command(target, profiles[0])
+    previous_epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    os.environ["SOURCE_DATE_EPOCH"] = "0"
+    try:
+        assert generated_at_utc() == "1970-01-01T00:00:00Z"
+        for bad_epoch in ("yesterday", "99999999999999999"):
+            os.environ["SOURCE_DATE_EPOCH"] = bad_epoch
+            try:
+                generated_at_utc()
+            except PolicyError as exc:
+                assert bad_epoch in str(exc)
+            else:
+                raise AssertionError(f"expected SOURCE_DATE_EPOCH={bad_epoch} rejection")
+    finally:
+        if previous_epoch is None:
+            del os.environ["SOURCE_DATE_EPOCH"]
+        else:
+            os.environ["SOURCE_DATE_EPOCH"] = previous_epoch
+    for token in ("cargo", "-Copt-level=1", "", "a b", "it's", "getrandom/wasm_js"):
+        assert shell_quote(token) == shlex.quote(token), token
+    assert load_trusted_contract(base_policy) == (target, required, forbidden, allowed_budgets, _summary_path)
+    assert load_trusted_profiles(base_policy, set()) == profiles
+
+    bad_missing_feature = build_self_test_policy()
     bad_missing_feature["profiles"][0]["cargo"]["features"] = ["wasm-browser-preview"]
     try:
         parse_profiles(bad_missing_feature, required, forbidden, allowed_budgets, set())
@@ -386,8 +578,8 @@ def run_self_test() -> None:
     else:
         raise AssertionError("expected missing required feature rejection")
 
-    bad_duplicate_variant = copy.deepcopy(base_policy)
-    bad_duplicate_variant["profiles"].append(copy.deepcopy(base_policy["profiles"][0]))
+    bad_duplicate_variant = build_self_test_policy()
+    bad_duplicate_variant["profiles"].extend(build_self_test_policy()["profiles"])
     bad_duplicate_variant["profiles"][1]["id"] = "wasm-browser-dev-2"
     try:
         parse_profiles(bad_duplicate_variant, required, forbidden, allowed_budgets, set())
@@ -396,6 +588,27 @@ def run_self_test() -> None:
     else:
         raise AssertionError("expected duplicate variant rejection")
 
+    try:
+        check_feature_matrix(
+            [("a", frozenset({"x"})), ("b", frozenset({"x", "y", "cli"}))],
+            frozenset({"x", "y"}),
+            frozenset({"cli"}),
+        )
+    except PolicyError as exc:
+        assert "profile a: missing required cargo.features: y" in str(exc)
+        assert "profile b: forbidden" in str(exc)
+    else:
+        raise AssertionError("expected feature matrix rejection")
+
+    bad_missing_field = build_self_test_policy()
+    del bad_missing_field["profiles"][0]["tradeoff"]
+    try:
+        parse_profiles(bad_missing_field, required, forbidden, allowed_budgets, set())
+    except PolicyError as exc:
+        assert "missing field tradeoff" in str(exc)
+    else:
+        raise AssertionError("expected missing field rejection")
+
 
 def main() -> int:
     args = parse_args()
@@ -406,9 +619,13 @@ def main() -> int:
 
     policy_path = pathlib.Path(args.policy)
     policy = load_json(policy_path)
-    target, required, forbidden, allowed_budgets, default_summary_path = parse_contract(policy)
     only_profiles = set(args.only_profile)
-    profiles = parse_profiles(policy, required, forbidden, allowed_budgets, only_profiles)
+    if args.skip_validation:
+        target, _, _, _, default_summary_path = load_trusted_contract(policy)
+        profiles = load_trusted_profiles(policy, only_profiles)
+    else:
+        target, required, forbidden, allowed_budgets, default_summary_path = parse_contract(policy)
+        profiles = parse_profiles(policy, required, forbidden, allowed_budgets, only_profiles)
 
     summary = build_summary(policy_path, target, profiles)
     summary_path = pathlib.Path(args.summary_output or default_summary_path)
@@ -5,13 +5,124 @@ from __future__ import annotations
 
 import argparse
 import copy
-import datetime as dt
 import json
 import pathlib
 import sys
+import time
 from typing import Any
 
 
+POLICY_SCHEMA_VERSION = "wasm-worker-offload-policy-v1"
+
+# Structural rules per policy section, declared once and applied by
+# check_structure before validate_policy runs its cross-field checks.
+POLICY_SECTIONS: tuple[dict[str, Any], ...] = (
+    {
+        "section": "invariants",
+        "bool_keys": (
+            "structured_ownership",
+            "region_close_implies_quiescence",
+            "no_obligation_leaks",
+            "no_ambient_authority",
+        ),
+        "const": {"cancellation_protocol": "request-drain-finalize"},
+    },
+    {
+        "section": "offload_triggers",
+        "positive_int_keys": (
+            "min_estimated_cpu_ns",
+            "max_main_thread_slice_ns",
+            "queue_backpressure_threshold",
+            "max_inline_retry_count",
+        ),
+    },
+    {
+        "section": "worker_pool",
+        "const": {"mode": "bounded-dedicated-pool"},
+        "positive_int_keys": (
+            "max_workers",
+            "max_inflight_jobs",
+            "max_payload_bytes",
+            "idle_shutdown_ms",
+        ),
+    },
+    {
+        "section": "message_protocol",
+        "nonempty_str_keys": ("envelope_version",),
+        "str_list_keys": (
+            "required_fields",
+            "request_operations",
+            "event_operations",
+            "payload_transfer_modes",
+            "states",
+            "terminal_states",
+        ),
+        "bool_keys": ("owned_payload_required",),
+    },
+    {
+        "section": "cancellation_contract",
+        "positive_int_keys": ("request_timeout_ms", "drain_timeout_ms", "finalize_timeout_ms"),
+        "str_list_keys": ("required_events",),
+    },
+    {
+        "section": "ownership_model",
+        "bool_keys": (
+            "region_affinity_required",
+            "obligation_commit_required",
+            "cross_region_handoff_forbidden",
+        ),
+        "const": {"stale_generation_behavior": "typed-error-drop-no-panic"},
+    },
+    {
+        "section": "determinism_contract",
+        "bool_keys": (
+            "seed_propagation_required",
+            "decision_seq_required",
+            "host_turn_id_required",
+            "replay_hash_required",
+        ),
+    },
+    {
+        "section": "output",
+        "nonempty_str_keys": ("summary_path",),
+    },
+)
+
+# Operations and events every v1 policy must declare.
+EXPECTED_REQUEST_OPS = frozenset(
+    {
+        "spawn_job",
+        "poll_status",
+        "cancel_job",
+        "drain_job",
+        "finalize_job",
+        "shutdown_worker",
+    }
+)
+EXPECTED_EVENT_OPS = frozenset(
+    {
+        "bootstrap_ready",
+        "bootstrap_failed",
+        "status_snapshot",
+        "job_completed",
+        "cancel_acknowledged",
+        "drain_completed",
+        "finalize_completed",
+        "shutdown_completed",
+        "diagnostic",
+    }
+)
+EXPECTED_CANCEL_EVENTS = frozenset(
+    {
+        "worker_cancel_requested",
+        "worker_cancel_acknowledged",
+        "worker_drain_started",
+        "worker_drain_completed",
+        "worker_finalize_completed",
+    }
+)
+
+
 class PolicyError(ValueError):
     """Raised when worker offload policy validation fails."""
 
@@ -38,69 +149,110 @@ def parse_args() -> argparse.Namespace:
 
 def load_json(path: pathlib.Path) -> dict[str, Any]:
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        raw = json.loads(path.read_bytes())
     except FileNotFoundError as exc:
         raise PolicyError(f"policy file not found: {path}") from exc
     except json.JSONDecodeError as exc:
         raise PolicyError(f"invalid JSON in policy file {path}: {exc}") from exc
-    if not isinstance(raw, dict):
+    if type(raw) is not dict:
         raise PolicyError("policy root must be an object")
     return raw
 
 
-def require_bool_map(section: dict[str, Any], keys: list[str], label: str) -> None:
-    for key in keys:
-        value = section.get(key)
-        if not isinstance(value, bool):
-            raise PolicyError(f"{label}.{key} must be bool")
-
-
-def require_nonempty_str_list(section: dict[str, Any], key: str, label: str) -> list[str]:
-    value = section.get(key)
-    if not isinstance(value, list) or not all(isinstance(item, str) and item for item in value):
-        raise PolicyError(f"{label}.{key} must be non-empty list[str]")
-    if not value:
-        raise PolicyError(f"{label}.{key} cannot be empty")
-    return value
-
+def _section_checks_source(sections: tuple[dict[str, Any], ...]) -> str:
+    """Emit straight-line Python source checking every POLICY_SECTIONS rule.
+
+    Field names and error messages are baked in as literals, so the
+    generated function does no spec walking or string formatting unless a
+    check fails.
+    """
+    lines = ["def _check_sections(policy):", "    get = policy.get"]
+
+    def fail(message: str) -> str:
+        return f"        raise PolicyError({message!r})"
+
+    for spec in sections:
+        label = spec["section"]
+        lines += [
+            f"    section = get({label!r})",
+            "    if type(section) is not dict:",
+            fail(f"{label} must be object"),
+        ]
+        for key in spec.get("bool_keys", ()):
+            lines += [
+                f"    if type(section.get({key!r})) is not bool:",
+                fail(f"{label}.{key} must be bool"),
+            ]
+        for key in spec.get("positive_int_keys", ()):
+            lines += [
+                f"    value = section.get({key!r})",
+                "    if type(value) is not int or value <= 0:",
+                fail(f"{label}.{key} must be positive int"),
+            ]
+        for key in spec.get("nonempty_str_keys", ()):
+            lines += [
+                f"    value = section.get({key!r})",
+                "    if type(value) is not str or not value:",
+                fail(f"{label}.{key} must be non-empty string"),
+            ]
+        for key in spec.get("str_list_keys", ()):
+            lines += [
+                f"    value = section.get({key!r})",
+                "    if type(value) is not list or not all(type(item) is str and item for item in value):",
+                fail(f"{label}.{key} must be non-empty list[str]"),
+                "    if not value:",
+                fail(f"{label}.{key} cannot be empty"),
+            ]
+        for key, expected in spec.get("const", {}).items():
+            lines += [
+                f"    if section.get({key!r}) != {expected!r}:",
+                fail(f"{label}.{key} must be {expected!r}"),
+            ]
+    return "\n".join(lines) + "\n"
+
+
+def _compile_section_checks(sections: tuple[dict[str, Any], ...]) -> Any:
+    namespace: dict[str, Any] = {"PolicyError": PolicyError}
+    exec(compile(_section_checks_source(sections), "<policy-section-checks>", "exec"), namespace)
+    return namespace["_check_sections"]
+
+
+_check_sections = _compile_section_checks(POLICY_SECTIONS)
+
+
+def check_structure(policy: dict[str, Any]) -> None:
+    """Apply the declarative POLICY_SECTIONS rules to every policy section."""
+    if policy.get("schema_version") != POLICY_SCHEMA_VERSION:
+        raise PolicyError("unsupported or missing schema_version")
+    _check_sections(policy)
 
-def require_positive_int(section: dict[str, Any], key: str, label: str) -> int:
-    value = section.get(key)
-    if not isinstance(value, int) or value <= 0:
-        raise PolicyError(f"{label}.{key} must be positive int")
-    return value
+    matrix = policy.get("test_matrix")
+    if type(matrix) is not list or not matrix:
+        raise PolicyError("test_matrix must be non-empty list")
+    for raw in matrix:
+        if type(raw) is not dict:
+            raise PolicyError("test_matrix entries must be objects")
+        matrix_id = raw.get("id")
+        focus = raw.get("focus")
+        required = raw.get("required")
+        if type(matrix_id) is not str or not matrix_id:
+            raise PolicyError("test_matrix.id must be non-empty string")
+        if type(focus) is not str or not focus:
+            raise PolicyError(f"test_matrix.{matrix_id}.focus must be non-empty string")
+        if type(required) is not bool:
+            raise PolicyError(f"test_matrix.{matrix_id}.required must be bool")
 
 
 def validate_policy(policy: dict[str, Any]) -> tuple[dict[str, Any], str]:
-    if policy.get("schema_version") != "wasm-worker-offload-policy-v1":
-        raise PolicyError("unsupported or missing schema_version")
-
-    invariants = policy.get("invariants")
-    if not isinstance(invariants, dict):
-        raise PolicyError("invariants must be object")
-    require_bool_map(
-        invariants,
-        [
-            "structured_ownership",
-            "region_close_implies_quiescence",
-            "no_obligation_leaks",
-            "no_ambient_authority",
-        ],
-        "invariants",
-    )
-    cancellation_protocol = invariants.get("cancellation_protocol")
-    if cancellation_protocol != "request-drain-finalize":
-        raise PolicyError("invariants.cancellation_protocol must be 'request-drain-finalize'")
-
-    triggers = policy.get("offload_triggers")
-    if not isinstance(triggers, dict):
-        raise PolicyError("offload_triggers must be object")
-    min_estimated_cpu_ns = require_positive_int(triggers, "min_estimated_cpu_ns", "offload_triggers")
-    max_main_thread_slice_ns = require_positive_int(triggers, "max_main_thread_slice_ns", "offload_triggers")
-    queue_backpressure_threshold = require_positive_int(
-        triggers, "queue_backpressure_threshold", "offload_triggers"
-    )
-    max_inline_retry_count = require_positive_int(triggers, "max_inline_retry_count", "offload_triggers")
+    check_structure(policy)
+
+    # Everything below has passed the structural rules; only cross-field
+    # constraints remain.
+    triggers = policy["offload_triggers"]
+    min_estimated_cpu_ns = triggers["min_estimated_cpu_ns"]
+    max_main_thread_slice_ns = triggers["max_main_thread_slice_ns"]
+    queue_backpressure_threshold = triggers["queue_backpressure_threshold"]
+    max_inline_retry_count = triggers["max_inline_retry_count"]
     if max_main_thread_slice_ns >= min_estimated_cpu_ns:
         raise PolicyError("offload_triggers.max_main_thread_slice_ns must be < min_estimated_cpu_ns")
     if max_inline_retry_count > 8:
@@ -108,16 +260,12 @@ def validate_policy(policy: dict[str, Any]) -> tuple[dict[str, Any], str]:
     if queue_backpressure_threshold < 16:
         raise PolicyError("offload_triggers.queue_backpressure_threshold must be >= 16")
 
-    worker_pool = policy.get("worker_pool")
-    if not isinstance(worker_pool, dict):
-        raise PolicyError("worker_pool must be object")
-    mode = worker_pool.get("mode")
-    if mode != "bounded-dedicated-pool":
-        raise PolicyError("worker_pool.mode must be 'bounded-dedicated-pool'")
-    max_workers = require_positive_int(worker_pool, "max_workers", "worker_pool")
-    max_inflight_jobs = require_positive_int(worker_pool, "max_inflight_jobs", "worker_pool")
-    max_payload_bytes = require_positive_int(worker_pool, "max_payload_bytes", "worker_pool")
-    idle_shutdown_ms = require_positive_int(worker_pool, "idle_shutdown_ms", "worker_pool")
+    worker_pool = policy["worker_pool"]
+    mode = worker_pool["mode"]
+    max_workers = worker_pool["max_workers"]
+    max_inflight_jobs = worker_pool["max_inflight_jobs"]
+    max_payload_bytes = worker_pool["max_payload_bytes"]
+    idle_shutdown_ms = worker_pool["idle_shutdown_ms"]
     if max_workers > 8:
         raise PolicyError("worker_pool.max_workers must be <= 8 for browser v1 policy")
     if max_inflight_jobs < max_workers:
@@ -125,62 +273,31 @@ def validate_policy(policy: dict[str, Any]) -> tuple[dict[str, Any], str]:
     if max_payload_bytes < 4096:
         raise PolicyError("worker_pool.max_payload_bytes must be >= 4096")
 
-    protocol = policy.get("message_protocol")
-    if not isinstance(protocol, dict):
-        raise PolicyError("message_protocol must be object")
-    envelope_version = protocol.get("envelope_version")
-    if not isinstance(envelope_version, str) or not envelope_version:
-        raise PolicyError("message_protocol.envelope_version must be non-empty string")
-    required_fields = require_nonempty_str_list(protocol, "required_fields", "message_protocol")
-    request_operations = require_nonempty_str_list(
-        protocol, "request_operations", "message_protocol"
-    )
-    event_operations = require_nonempty_str_list(
-        protocol, "event_operations", "message_protocol"
-    )
-    payload_transfer_modes = require_nonempty_str_list(
-        protocol, "payload_transfer_modes", "message_protocol"
-    )
-    owned_payload_required = protocol.get("owned_payload_required")
-    if not isinstance(owned_payload_required, bool):
-        raise PolicyError("message_protocol.owned_payload_required must be bool")
-    states = require_nonempty_str_list(protocol, "states", "message_protocol")
-    terminal_states = require_nonempty_str_list(protocol, "terminal_states", "message_protocol")
-    missing_terminal = sorted(set(terminal_states).difference(states))
-    if missing_terminal:
+    protocol = policy["message_protocol"]
+    envelope_version = protocol["envelope_version"]
+    required_fields = protocol["required_fields"]
+    request_operations = protocol["request_operations"]
+    event_operations = protocol["event_operations"]
+    payload_transfer_modes = protocol["payload_transfer_modes"]
+    owned_payload_required = protocol["owned_payload_required"]
+    states = protocol["states"]
+    terminal_states = protocol["terminal_states"]
+    # Sorted diffs are only materialized for the error message.
+    if not set(terminal_states).issubset(states):
+        missing_terminal = sorted(set(terminal_states).difference(states))
         raise PolicyError(
             "message_protocol.terminal_states must be subset of states "
             f"(missing: {', '.join(missing_terminal)})"
         )
-    expected_request_ops = {
-        "spawn_job",
-        "poll_status",
-        "cancel_job",
-        "drain_job",
-        "finalize_job",
-        "shutdown_worker",
-    }
-    missing_request_ops = sorted(expected_request_ops.difference(request_operations))
-    if missing_request_ops:
+    if not EXPECTED_REQUEST_OPS.issubset(request_operations):
         raise PolicyError(
             "message_protocol.request_operations missing: "
-            + ", ".join(missing_request_ops)
+            + ", ".join(sorted(EXPECTED_REQUEST_OPS.difference(request_operations)))
         )
-    expected_event_ops = {
-        "bootstrap_ready",
-        "bootstrap_failed",
-        "status_snapshot",
-        "job_completed",
-        "cancel_acknowledged",
-        "drain_completed",
-        "finalize_completed",
-        "shutdown_completed",
-        "diagnostic",
-    }
-    missing_event_ops = sorted(expected_event_ops.difference(event_operations))
-    if missing_event_ops:
+    if not EXPECTED_EVENT_OPS.issubset(event_operations):
         raise PolicyError(
-            "message_protocol.event_operations missing: " + ", ".join(missing_event_ops)
+            "message_protocol.event_operations missing: "
+            + ", ".join(sorted(EXPECTED_EVENT_OPS.difference(event_operations)))
         )
     if "job_id" not in required_fields or "obligation_id" not in required_fields:
         raise PolicyError("message_protocol.required_fields must include job_id and obligation_id")
@@ -195,93 +312,27 @@ def validate_policy(policy: dict[str, Any]) -> tuple[dict[str, Any], str]:
     if not owned_payload_required:
         raise PolicyError("message_protocol.owned_payload_required must be true")
 
-    cancellation = policy.get("cancellation_contract")
-    if not isinstance(cancellation, dict):
-        raise PolicyError("cancellation_contract must be object")
-    require_positive_int(cancellation, "request_timeout_ms", "cancellation_contract")
-    require_positive_int(cancellation, "drain_timeout_ms", "cancellation_contract")
-    require_positive_int(cancellation, "finalize_timeout_ms", "cancellation_contract")
-    required_events = require_nonempty_str_list(
-        cancellation, "required_events", "cancellation_contract"
-    )
-    expected_events = {
-        "worker_cancel_requested",
-        "worker_cancel_acknowledged",
-        "worker_drain_started",
-        "worker_drain_completed",
-        "worker_finalize_completed",
-    }
-    missing_events = sorted(expected_events.difference(required_events))
-    if missing_events:
-        raise PolicyError(
-            "cancellation_contract.required_events missing: " + ", ".join(missing_events)
-        )
-
-    ownership = policy.get("ownership_model")
-    if not isinstance(ownership, dict):
-        raise PolicyError("ownership_model must be object")
-    require_bool_map(
-        ownership,
-        [
-            "region_affinity_required",
-            "obligation_commit_required",
-            "cross_region_handoff_forbidden",
-        ],
-        "ownership_model",
-    )
-    stale_generation_behavior = ownership.get("stale_generation_behavior")
-    if stale_generation_behavior != "typed-error-drop-no-panic":
+    required_events = policy["cancellation_contract"]["required_events"]
+    if not EXPECTED_CANCEL_EVENTS.issubset(required_events):
         raise PolicyError(
-            "ownership_model.stale_generation_behavior must be 'typed-error-drop-no-panic'"
+            "cancellation_contract.required_events missing: "
+            + ", ".join(sorted(EXPECTED_CANCEL_EVENTS.difference(required_events)))
         )
 
-    determinism = policy.get("determinism_contract")
-    if not isinstance(determinism, dict):
-        raise PolicyError("determinism_contract must be object")
-    require_bool_map(
-        determinism,
-        [
-            "seed_propagation_required",
-            "decision_seq_required",
-            "host_turn_id_required",
-            "replay_hash_required",
-        ],
-        "determinism_contract",
-    )
-
-    matrix = policy.get("test_matrix")
-    if not isinstance(matrix, list) or not matrix:
-        raise PolicyError("test_matrix must be non-empty list")
     matrix_ids: list[str] = []
-    for raw in matrix:
-        if not isinstance(raw, dict):
-            raise PolicyError("test_matrix entries must be objects")
-        matrix_id = raw.get("id")
-        focus = raw.get("focus")
-        required = raw.get("required")
-        if not isinstance(matrix_id, str) or not matrix_id:
-            raise PolicyError("test_matrix.id must be non-empty string")
-        if not isinstance(focus, str) or not focus:
-            raise PolicyError(f"test_matrix.{matrix_id}.focus must be non-empty string")
-        if not isinstance(required, bool):
-            raise PolicyError(f"test_matrix.{matrix_id}.required must be bool")
+    seen_ids: set[str] = set()
+    for raw in policy["test_matrix"]:
+        matrix_id = raw["id"]
+        if matrix_id in seen_ids:
+            raise PolicyError(f"test_matrix.id must be unique (duplicate: {matrix_id})")
+        seen_ids.add(matrix_id)
         matrix_ids.append(matrix_id)
-    if len(matrix_ids) != len(set(matrix_ids)):
-        raise PolicyError("test_matrix.id must be unique")
 
-    output = policy.get("output")
-    if not isinstance(output, dict):
-        raise PolicyError("output must be object")
-    summary_path = output.get("summary_path")
-    if not isinstance(summary_path, str) or not summary_path:
-        raise PolicyError("output.summary_path must be non-empty string")
+    summary_path = policy["output"]["summary_path"]
 
     summary = {
         "schema_version": "wasm-worker-offload-summary-v1",
-        "generated_at_utc": dt.datetime.now(dt.timezone.utc)
-        .replace(microsecond=0)
-        .isoformat()
-        .replace("+00:00", "Z"),
+        "generated_at_utc": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         "trigger_thresholds": {
             "min_estimated_cpu_ns": min_estimated_cpu_ns,
             "max_main_thread_slice_ns": max_main_thread_slice_ns,
@@ -317,7 +368,7 @@ def write_summary(path: pathlib.Path, summary: dict[str, Any]) -> None:
 
 def run_self_test() -> None:
     base_policy: dict[str, Any] = {
-        "schema_version": "wasm-worker-offload-policy-v1",
+        "schema_version": POLICY_SCHEMA_VERSION,
         "invariants": {
             "structured_ownership": True,
             "region_close_implies_quiescence": True,
@@ -422,6 +473,33 @@ def run_self_test() -> None:
     else:
         raise AssertionError("expected terminal state subset validation to fail")
 
+    bad_policy3 = copy.deepcopy(base_policy)
+    bad_policy3["cancellation_contract"]["request_timeout_ms"] = True
+    try:
+        validate_policy(bad_policy3)
+    except PolicyError:
+        pass
+    else:
+        raise AssertionError("expected bool to be rejected as positive int")
+
+    const_policy = copy.deepcopy(base_policy)
+    const_policy["worker_pool"]["mode"] = "shared"
+    try:
+        validate_policy(const_policy)
+    except PolicyError as exc:
+        assert str(exc) == "worker_pool.mode must be 'bounded-dedicated-pool'", str(exc)
+    else:
+        raise AssertionError("expected worker_pool.mode constant validation to fail")
+
+    dup_policy = copy.deepcopy(base_policy)
+    dup_policy["test_matrix"].append({"id": "WKR-CANCEL", "focus": "drain", "required": False})
+    try:
+        validate_policy(dup_policy)
+    except PolicyError as exc:
+        assert "WKR-CANCEL" in str(exc)
+    else:
+        raise AssertionError("expected duplicate test_matrix.id to fail")
+
 
 def main() -> int:
     args = parse_args()
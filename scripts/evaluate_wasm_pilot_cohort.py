@@ -6,21 +6,36 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import re
 import sys
-from dataclasses import dataclass
-from datetime import UTC, datetime
+import time
 from pathlib import Path
-import unittest
 
 
-ALLOWED_PROFILES = {
-    "FP-BR-MIN",
-    "FP-BR-DEV",
-    "FP-BR-PROD",
-    "FP-BR-DET",
-}
+# Candidate scoring tables used by compute_score. Their keys are also the
+# allowed profiles and supported frameworks, so evaluate_candidate checks
+# membership against them directly.
+PROFILE_SCORES = {"FP-BR-DEV": 30, "FP-BR-DET": 30, "FP-BR-PROD": 20, "FP-BR-MIN": 20}
+FRAMEWORK_SCORES = {"vanilla": 10, "react": 10, "next": 10}
 
-SUPPORTED_FRAMEWORKS = {"vanilla", "react", "next"}
+# Telemetry events are validated against the same framework set.
+SUPPORTED_FRAMEWORKS = frozenset(FRAMEWORK_SCORES)
+READINESS_SCORES = (
+    ("has_replay_pipeline", 15),
+    ("has_ci", 10),
+    ("security_owner", 10),
+    ("support_contact", 5),
+)
+# Exact JSON types required of candidate fields when present. Rows that
+# break these are reported as malformed and never scored. The readiness
+# flags are only tested for truthiness, so they are not type-checked;
+# pilot_window_days is checked separately because compute_score coerces it.
+CANDIDATE_FIELD_TYPES = {
+    "profile": str,
+    "frameworks": list,
+    "requested_capabilities": list,
+}
+CANDIDATE_STR_LIST_FIELDS = ("frameworks", "requested_capabilities")
 SUPPORTED_PROFILE_FAMILIES = {"native", "wasm"}
 DEFERRED_SURFACE_PREFIXES = (
     "native_socket",
@@ -35,6 +50,8 @@ DEFERRED_SURFACE_PREFIXES = (
     "quic_native",
     "http3_native",
 )
+# One alternation matched by the C regex engine instead of a per-prefix loop.
+DEFERRED_SURFACE_RE = re.compile("|".join(map(re.escape, DEFERRED_SURFACE_PREFIXES)))
 
 TELEMETRY_SCHEMA_VERSION = "asupersync-pilot-observability-v1"
 TELEMETRY_ALERT_EVENT = "pilot_slo_alert"
@@ -62,31 +79,7 @@ def now_iso() -> str:
     forced_ts = os.environ.get("ASUPERSYNC_EVAL_TS")
     if forced_ts:
         return forced_ts
-    return datetime.now(UTC).isoformat()
-
-
-@dataclass(frozen=True)
-class Evaluation:
-    candidate_id: str
-    eligible: bool
-    score: int
-    risk_tier: str
-    exclusion_reasons: list[str]
-    warning_flags: list[str]
-    selected_frameworks: list[str]
-    profile: str
-
-    def as_dict(self) -> dict:
-        return {
-            "candidate_id": self.candidate_id,
-            "eligible": self.eligible,
-            "score": self.score,
-            "risk_tier": self.risk_tier,
-            "exclusion_reasons": self.exclusion_reasons,
-            "warning_flags": self.warning_flags,
-            "selected_frameworks": self.selected_frameworks,
-            "profile": self.profile,
-        }
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
 def validate_telemetry_events(events: list[dict]) -> list[str]:
@@ -378,49 +371,21 @@ def evaluate_telemetry(payload: dict | list[dict]) -> dict:
 
 
 def normalize_frameworks(values: list[str]) -> list[str]:
-    return sorted({v.strip().lower() for v in values if v.strip()})
+    return sorted({s for v in values if (s := v.strip().lower())})
 
 
 def has_deferred_surface(values: list[str]) -> bool:
-    lowered = [v.strip().lower() for v in values]
-    for item in lowered:
-        for prefix in DEFERRED_SURFACE_PREFIXES:
-            if item.startswith(prefix):
-                return True
-    return False
+    match = DEFERRED_SURFACE_RE.match
+    return any(match(s) for v in values if (s := v.strip().lower()))
 
 
-def compute_score(candidate: dict) -> int:
-    score = 0
-    frameworks = normalize_frameworks(candidate.get("frameworks", []))
-    profile = candidate.get("profile", "")
-    has_replay_pipeline = bool(candidate.get("has_replay_pipeline", False))
-    has_ci = bool(candidate.get("has_ci", False))
-    security_owner = bool(candidate.get("security_owner", False))
-    support_contact = bool(candidate.get("support_contact", False))
-    pilot_window_days = int(candidate.get("pilot_window_days", 0))
-
-    if profile in {"FP-BR-DEV", "FP-BR-DET"}:
-        score += 30
-    elif profile in {"FP-BR-PROD", "FP-BR-MIN"}:
-        score += 20
-
-    if "vanilla" in frameworks:
-        score += 10
-    if "react" in frameworks:
-        score += 10
-    if "next" in frameworks:
-        score += 10
-
-    if has_replay_pipeline:
-        score += 15
-    if has_ci:
-        score += 10
-    if security_owner:
-        score += 10
-    if support_contact:
-        score += 5
+def compute_score(candidate: dict, frameworks: list[str]) -> int:
+    """Score a candidate; frameworks must already be normalized (deduplicated)."""
+    score = PROFILE_SCORES.get(candidate.get("profile", ""), 0)
+    score += sum(FRAMEWORK_SCORES.get(framework, 0) for framework in frameworks)
+    score += sum(points for flag, points in READINESS_SCORES if candidate.get(flag))
 
+    pilot_window_days = int(candidate.get("pilot_window_days", 0))
     if 7 <= pilot_window_days <= 30:
         score += 10
     elif pilot_window_days > 30:
@@ -429,8 +394,7 @@ def compute_score(candidate: dict) -> int:
     return score
 
 
-def risk_tier_for(candidate: dict, score: int) -> str:
-    deferred = has_deferred_surface(candidate.get("requested_capabilities", []))
+def risk_tier_for(candidate: dict, score: int, deferred: bool) -> str:
     replay = bool(candidate.get("has_replay_pipeline", False))
     profile = candidate.get("profile", "")
 
@@ -443,7 +407,36 @@ def risk_tier_for(candidate: dict, score: int) -> str:
     return "medium"
 
 
-def evaluate_candidate(candidate: dict) -> Evaluation:
+def _is_window_days(value: object) -> bool:
+    """True when compute_score's int() coercion accepts value; bool is rejected."""
+    if type(value) is bool:
+        return False
+    try:
+        int(value)
+    except (TypeError, ValueError, OverflowError):
+        return False
+    return True
+
+
+def candidate_errors(candidate: object) -> list[str]:
+    """Return structural problems that would make a candidate unscoreable."""
+    if type(candidate) is not dict:
+        return ["candidate must be an object"]
+    errors = [
+        f"{key} must be {kind.__name__}"
+        for key, kind in CANDIDATE_FIELD_TYPES.items()
+        if key in candidate and type(candidate[key]) is not kind
+    ]
+    for key in CANDIDATE_STR_LIST_FIELDS:
+        value = candidate.get(key)
+        if type(value) is list and not all(type(item) is str for item in value):
+            errors.append(f"{key} entries must be strings")
+    if "pilot_window_days" in candidate and not _is_window_days(candidate["pilot_window_days"]):
+        errors.append("pilot_window_days must be an integer")
+    return errors
+
+
+def evaluate_candidate(candidate: dict) -> dict:
     candidate_id = str(candidate.get("candidate_id", "unknown"))
     profile = str(candidate.get("profile", ""))
     frameworks = normalize_frameworks(candidate.get("frameworks", []))
@@ -452,17 +445,19 @@ def evaluate_candidate(candidate: dict) -> Evaluation:
     exclusion_reasons: list[str] = []
     warning_flags: list[str] = []
 
-    if profile not in ALLOWED_PROFILES:
+    if profile not in PROFILE_SCORES:
         exclusion_reasons.append("profile_not_allowed")
 
-    unsupported_frameworks = [f for f in frameworks if f not in SUPPORTED_FRAMEWORKS]
+    # frameworks is already sorted and unique, so the filtered list is too.
+    unsupported_frameworks = [f for f in frameworks if f not in FRAMEWORK_SCORES]
     if unsupported_frameworks:
-        exclusion_reasons.append(f"unsupported_frameworks:{','.join(sorted(unsupported_frameworks))}")
+        exclusion_reasons.append(f"unsupported_frameworks:{','.join(unsupported_frameworks)}")
 
     if not frameworks:
         exclusion_reasons.append("no_framework_selected")
 
-    if has_deferred_surface(requested_caps):
+    deferred = has_deferred_surface(requested_caps)
+    if deferred:
         exclusion_reasons.append("requested_deferred_surface")
 
     if not candidate.get("support_contact"):
@@ -472,54 +467,74 @@ def evaluate_candidate(candidate: dict) -> Evaluation:
     if not candidate.get("has_replay_pipeline"):
         warning_flags.append("missing_replay_pipeline")
 
-    score = compute_score(candidate)
-    risk_tier = risk_tier_for(candidate, score)
+    score = compute_score(candidate, frameworks)
+    risk_tier = risk_tier_for(candidate, score, deferred)
     eligible = len(exclusion_reasons) == 0
 
-    return Evaluation(
-        candidate_id=candidate_id,
-        eligible=eligible,
-        score=score,
-        risk_tier=risk_tier,
-        exclusion_reasons=sorted(exclusion_reasons),
-        warning_flags=sorted(warning_flags),
-        selected_frameworks=frameworks,
-        profile=profile,
-    )
+    return {
+        "candidate_id": candidate_id,
+        "eligible": eligible,
+        "score": score,
+        "risk_tier": risk_tier,
+        "exclusion_reasons": sorted(exclusion_reasons),
+        "warning_flags": sorted(warning_flags),
+        "selected_frameworks": frameworks,
+        "profile": profile,
+    }
 
 
 def evaluate(candidates: list[dict]) -> dict:
-    rows = [evaluate_candidate(c) for c in candidates]
-    accepted = [r for r in rows if r.eligible]
+    rows: list[dict] = []
+    malformed: list[dict] = []
+    for index, candidate in enumerate(candidates):
+        errors = candidate_errors(candidate)
+        if errors:
+            candidate_id = candidate.get("candidate_id", "unknown") if type(candidate) is dict else "unknown"
+            malformed.append({"index": index, "candidate_id": str(candidate_id), "errors": errors})
+        else:
+            rows.append(evaluate_candidate(candidate))
+    accepted = [r for r in rows if r["eligible"]]
 
     return {
         "schema": "asupersync-pilot-cohort-eval-v1",
         "generated_at": now_iso(),
-        "candidate_count": len(rows),
+        "candidate_count": len(candidates),
+        "malformed_count": len(malformed),
         "eligible_count": len(accepted),
-        "results": [r.as_dict() for r in rows],
+        "results": rows,
+        "malformed": malformed,
     }
 
 
 def write_intake_log(path: Path, evaluations: dict, source_file: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        for row in evaluations["results"]:
-            event = {
-                "ts": evaluations["generated_at"],
-                "event": "pilot_intake_evaluation",
-                "source_file": source_file,
-                "candidate_id": row["candidate_id"],
-                "eligible": row["eligible"],
-                "score": row["score"],
-                "risk_tier": row["risk_tier"],
-                "profile": row["profile"],
-                "frameworks": row["selected_frameworks"],
-                "warning_flags": row["warning_flags"],
-                "exclusion_reasons": row["exclusion_reasons"],
-            }
-            f.write(json.dumps(event, sort_keys=True))
-            f.write("\n")
+    ts = evaluations["generated_at"]
+    events = [
+        {
+            "ts": ts,
+            "event": "pilot_intake_evaluation",
+            "source_file": source_file,
+            "candidate_id": row["candidate_id"],
+            "eligible": row["eligible"],
+            "score": row["score"],
+            "risk_tier": row["risk_tier"],
+            "profile": row["profile"],
+            "frameworks": row["selected_frameworks"],
+            "warning_flags": row["warning_flags"],
+            "exclusion_reasons": row["exclusion_reasons"],
+        }
+        for row in evaluations["results"]
+    ]
+    # Encode every row up front and write the buffer straight to the fd,
+    # bypassing the text-mode file object.
+    payload = "".join(json.dumps(event, sort_keys=True) + "\n" for event in events).encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 def write_telemetry_log(path: Path, summary: dict, source_file: str) -> None:
@@ -552,181 +567,236 @@ def write_telemetry_log(path: Path, summary: dict, source_file: str) -> None:
         f.write("\n")
 
 
-class EvaluatorTests(unittest.TestCase):
-    def sample_telemetry_event(self, **overrides: object) -> dict:
-        base = {
-            "scenario_id": "pilot-drill-1",
-            "framework": "react",
-            "profile_family": "wasm",
-            "signal_name": "incident_mtta_minutes",
-            "signal_source": "pilot_drill",
-            "signal_value": 8.0,
-            "threshold_kind": "max",
-            "threshold_value": 15.0,
-            "capability_surface": "wasm.replay",
-            "owner_route": "oncall:wasm-runtime",
-            "replay_command": "asupersync lab replay examples/scenarios/smoke_happy_path.yaml --seed 4242",
-            "trace_pointer": "artifacts/replay/pilot-drill-1.json",
-            "remediation_pointer": "docs/wasm_pilot_observability_contract.md#incident-response",
-            "parity_tolerance_pct": 5.0,
-        }
-        base.update(overrides)
-        return base
-
-    def test_accepts_low_risk_candidate(self) -> None:
-        candidate = {
-            "candidate_id": "acme-frontend",
-            "profile": "FP-BR-DET",
-            "frameworks": ["react"],
-            "requested_capabilities": ["fetch"],
-            "has_replay_pipeline": True,
-            "has_ci": True,
-            "security_owner": True,
-            "support_contact": True,
-            "pilot_window_days": 14,
-        }
-        result = evaluate_candidate(candidate)
-        self.assertTrue(result.eligible)
-        self.assertEqual(result.risk_tier, "low")
-        self.assertGreaterEqual(result.score, 70)
-
-    def test_rejects_deferred_surface_request(self) -> None:
-        candidate = {
-            "candidate_id": "legacy-io",
-            "profile": "FP-BR-DEV",
-            "frameworks": ["next"],
-            "requested_capabilities": ["native_socket_listener"],
-            "has_replay_pipeline": True,
-            "has_ci": True,
-            "security_owner": False,
-            "support_contact": True,
-            "pilot_window_days": 10,
-        }
-        result = evaluate_candidate(candidate)
-        self.assertFalse(result.eligible)
-        self.assertIn("requested_deferred_surface", result.exclusion_reasons)
-
-    def test_rejects_unknown_profile(self) -> None:
-        candidate = {
-            "candidate_id": "invalid-profile",
-            "profile": "FP-UNKNOWN",
-            "frameworks": ["vanilla"],
-            "requested_capabilities": ["fetch"],
-            "has_replay_pipeline": True,
-            "has_ci": True,
-            "security_owner": True,
-            "support_contact": True,
-            "pilot_window_days": 10,
-        }
-        result = evaluate_candidate(candidate)
-        self.assertFalse(result.eligible)
-        self.assertIn("profile_not_allowed", result.exclusion_reasons)
-
-    def test_normalization_of_frameworks(self) -> None:
-        normalized = normalize_frameworks(["React", "react", "NEXT", ""])
-        self.assertEqual(normalized, ["next", "react"])
-
-    def test_telemetry_summary_passes_when_thresholds_and_parity_hold(self) -> None:
-        payload = {
-            "seed": 4242,
-            "events": [
-                self.sample_telemetry_event(
-                    framework="react",
-                    profile_family="wasm",
-                    signal_name="incident_mtta_minutes",
-                    signal_value=8.0,
-                    threshold_kind="max",
-                    threshold_value=15.0,
-                ),
-                self.sample_telemetry_event(
-                    framework="react",
-                    profile_family="native",
-                    signal_name="incident_mtta_minutes",
-                    signal_value=8.2,
-                    threshold_kind="max",
-                    threshold_value=15.0,
-                ),
-            ],
-        }
+def _make_tests_class() -> type:
+    """Build the self-test case; unittest is only imported for --self-test."""
+    import unittest
+
+    class EvaluatorTests(unittest.TestCase):
+        def sample_telemetry_event(self, **overrides: object) -> dict:
+            base = {
+                "scenario_id": "pilot-drill-1",
+                "framework": "react",
+                "profile_family": "wasm",
+                "signal_name": "incident_mtta_minutes",
+                "signal_source": "pilot_drill",
+                "signal_value": 8.0,
+                "threshold_kind": "max",
+                "threshold_value": 15.0,
+                "capability_surface": "wasm.replay",
+                "owner_route": "oncall:wasm-runtime",
+                "replay_command": "asupersync lab replay examples/scenarios/smoke_happy_path.yaml --seed 4242",
+                "trace_pointer": "artifacts/replay/pilot-drill-1.json",
+                "remediation_pointer": "docs/wasm_pilot_observability_contract.md#incident-response",
+                "parity_tolerance_pct": 5.0,
+            }
+            base.update(overrides)
+            return base
+
+        def test_accepts_low_risk_candidate(self) -> None:
+            candidate = {
+                "candidate_id": "acme-frontend",
+                "profile": "FP-BR-DET",
+                "frameworks": ["react"],
+                "requested_capabilities": ["fetch"],
+                "has_replay_pipeline": True,
+                "has_ci": True,
+                "security_owner": True,
+                "support_contact": True,
+                "pilot_window_days": 14,
+            }
+            result = evaluate_candidate(candidate)
+            self.assertTrue(result["eligible"])
+            self.assertEqual(result["risk_tier"], "low")
+            self.assertGreaterEqual(result["score"], 70)
+
+        def test_rejects_deferred_surface_request(self) -> None:
+            candidate = {
+                "candidate_id": "legacy-io",
+                "profile": "FP-BR-DEV",
+                "frameworks": ["next"],
+                "requested_capabilities": ["native_socket_listener"],
+                "has_replay_pipeline": True,
+                "has_ci": True,
+                "security_owner": False,
+                "support_contact": True,
+                "pilot_window_days": 10,
+            }
+            result = evaluate_candidate(candidate)
+            self.assertFalse(result["eligible"])
+            self.assertIn("requested_deferred_surface", result["exclusion_reasons"])
+
+        def test_rejects_unknown_profile(self) -> None:
+            candidate = {
+                "candidate_id": "invalid-profile",
+                "profile": "FP-UNKNOWN",
+                "frameworks": ["vanilla"],
+                "requested_capabilities": ["fetch"],
+                "has_replay_pipeline": True,
+                "has_ci": True,
+                "security_owner": True,
+                "support_contact": True,
+                "pilot_window_days": 10,
+            }
+            result = evaluate_candidate(candidate)
+            self.assertFalse(result["eligible"])
+            self.assertIn("profile_not_allowed", result["exclusion_reasons"])
+
+        def test_malformed_candidates_are_reported_not_scored(self) -> None:
+            evaluations = evaluate(
+                [
+                    {"candidate_id": "ok", "profile": "FP-BR-DEV", "frameworks": ["react"]},
+                    {"candidate_id": "bad-frameworks", "frameworks": "react"},
+                    {"candidate_id": "bad-entry", "frameworks": ["react", 3]},
+                    "not-an-object",
+                ]
+            )
+            self.assertEqual(evaluations["candidate_count"], 4)
+            self.assertEqual(evaluations["malformed_count"], 3)
+            self.assertEqual(
+                [row["candidate_id"] for row in evaluations["malformed"]],
+                ["bad-frameworks", "bad-entry", "unknown"],
+            )
+            self.assertEqual(evaluations["malformed"][0]["errors"], ["frameworks must be list"])
+
+        def test_pilot_window_days_must_be_int(self) -> None:
+            evaluations = evaluate(
+                [
+                    {"candidate_id": "text", "frameworks": ["react"], "pilot_window_days": "two weeks"},
+                    {"candidate_id": "null", "frameworks": ["react"], "pilot_window_days": None},
+                    {"candidate_id": "flag", "frameworks": ["react"], "pilot_window_days": True},
+                    {"candidate_id": "truthy", "frameworks": ["react"], "has_ci": 1},
+                    {"candidate_id": "str-days", "frameworks": ["react"], "pilot_window_days": "14"},
+                    {"candidate_id": "float-days", "frameworks": ["react"], "pilot_window_days": 14.0},
+                ]
+            )
+            self.assertEqual(
+                [row["candidate_id"] for row in evaluations["malformed"]],
+                ["text", "null", "flag"],
+            )
+            self.assertEqual(
+                evaluations["malformed"][0]["errors"], ["pilot_window_days must be an integer"]
+            )
+            self.assertEqual(evaluations["candidate_count"], 6)
+            self.assertEqual(evaluations["malformed_count"], 3)
+            scores = {row["candidate_id"]: row for row in evaluations["results"]}
+            self.assertNotIn("missing_ci", scores["truthy"]["warning_flags"])
+            expected = compute_score({"pilot_window_days": 14}, ["react"])
+            self.assertEqual(scores["str-days"]["score"], expected)
+            self.assertEqual(scores["float-days"]["score"], expected)
+
+        def test_deferred_surface_matches_prefixes_case_insensitively(self) -> None:
+            self.assertTrue(has_deferred_surface(["fetch", "  IO_URING_submit "]))
+            self.assertFalse(has_deferred_surface(["fetch", "websocket", ""]))
+
+        def test_normalization_of_frameworks(self) -> None:
+            normalized = normalize_frameworks(["React", "react", "NEXT", ""])
+            self.assertEqual(normalized, ["next", "react"])
+
+        def test_telemetry_summary_passes_when_thresholds_and_parity_hold(self) -> None:
+            payload = {
+                "seed": 4242,
+                "events": [
+                    self.sample_telemetry_event(
+                        framework="react",
+                        profile_family="wasm",
+                        signal_name="incident_mtta_minutes",
+                        signal_value=8.0,
+                        threshold_kind="max",
+                        threshold_value=15.0,
+                    ),
+                    self.sample_telemetry_event(
+                        framework="react",
+                        profile_family="native",
+                        signal_name="incident_mtta_minutes",
+                        signal_value=8.2,
+                        threshold_kind="max",
+                        threshold_value=15.0,
+                    ),
+                ],
+            }
 
-        summary = evaluate_telemetry(payload)
-        self.assertEqual(summary["schema_version"], TELEMETRY_SCHEMA_VERSION)
-        self.assertEqual(summary["status"], "pass")
-        self.assertEqual(summary["alerts_count"], 0)
-        self.assertTrue(summary["ci_parity_ok"])
-
-    def test_telemetry_alerts_include_owner_route_and_trace_pointer(self) -> None:
-        payload = {
-            "events": [
-                self.sample_telemetry_event(
-                    signal_name="error_budget_burn_pct",
-                    signal_value=12.0,
-                    threshold_kind="max",
-                    threshold_value=5.0,
-                    owner_route="oncall:pilot-sre",
-                ),
-                self.sample_telemetry_event(
-                    profile_family="native",
-                    signal_name="error_budget_burn_pct",
-                    signal_value=4.0,
-                    threshold_kind="max",
-                    threshold_value=5.0,
-                    owner_route="oncall:pilot-sre",
-                ),
-            ]
-        }
-        summary = evaluate_telemetry(payload)
-        self.assertEqual(summary["status"], "fail")
-        self.assertGreaterEqual(summary["alerts_count"], 1)
-        alert = summary["alerts"][0]
-        for required in [
-            "owner_route",
-            "replay_command",
-            "trace_pointer",
-            "remediation_pointer",
-            "signal_source",
-            "capability_surface",
-        ]:
-            self.assertIn(required, alert)
-            self.assertTrue(alert[required])
-
-    def test_telemetry_parity_check_flags_drift(self) -> None:
-        payload = {
-            "events": [
-                self.sample_telemetry_event(
-                    framework="next",
-                    profile_family="wasm",
-                    signal_name="replay_success_rate_pct",
-                    signal_value=90.0,
-                    threshold_kind="min",
-                    threshold_value=89.0,
-                    parity_tolerance_pct=3.0,
-                ),
-                self.sample_telemetry_event(
-                    framework="next",
-                    profile_family="native",
-                    signal_name="replay_success_rate_pct",
-                    signal_value=100.0,
-                    threshold_kind="min",
-                    threshold_value=89.0,
-                    parity_tolerance_pct=3.0,
-                ),
-            ]
-        }
-        summary = evaluate_telemetry(payload)
-        self.assertEqual(summary["status"], "fail")
-        self.assertFalse(summary["ci_parity_ok"])
-        self.assertTrue(any(row["breach"] for row in summary["parity_checks"]))
+            summary = evaluate_telemetry(payload)
+            self.assertEqual(summary["schema_version"], TELEMETRY_SCHEMA_VERSION)
+            self.assertEqual(summary["status"], "pass")
+            self.assertEqual(summary["alerts_count"], 0)
+            self.assertTrue(summary["ci_parity_ok"])
+
+        def test_telemetry_alerts_include_owner_route_and_trace_pointer(self) -> None:
+            payload = {
+                "events": [
+                    self.sample_telemetry_event(
+                        signal_name="error_budget_burn_pct",
+                        signal_value=12.0,
+                        threshold_kind="max",
+                        threshold_value=5.0,
+                        owner_route="oncall:pilot-sre",
+                    ),
+                    self.sample_telemetry_event(
+                        profile_family="native",
+                        signal_name="error_budget_burn_pct",
+                        signal_value=4.0,
+                        threshold_kind="max",
+                        threshold_value=5.0,
+                        owner_route="oncall:pilot-sre",
+                    ),
+                ]
+            }
+            summary = evaluate_telemetry(payload)
+            self.assertEqual(summary["status"], "fail")
+            self.assertGreaterEqual(summary["alerts_count"], 1)
+            alert = summary["alerts"][0]
+            for required in [
+                "owner_route",
+                "replay_command",
+                "trace_pointer",
+                "remediation_pointer",
+                "signal_source",
+                "capability_surface",
+            ]:
+                self.assertIn(required, alert)
+                self.assertTrue(alert[required])
+
+        def test_telemetry_parity_check_flags_drift(self) -> None:
+            payload = {
+                "events": [
+                    self.sample_telemetry_event(
+                        framework="next",
+                        profile_family="wasm",
+                        signal_name="replay_success_rate_pct",
+                        signal_value=90.0,
+                        threshold_kind="min",
+                        threshold_value=89.0,
+                        parity_tolerance_pct=3.0,
+                    ),
+                    self.sample_telemetry_event(
+                        framework="next",
+                        profile_family="native",
+                        signal_name="replay_success_rate_pct",
+                        signal_value=100.0,
+                        threshold_kind="min",
+                        threshold_value=89.0,
+                        parity_tolerance_pct=3.0,
+                    ),
+                ]
+            }
+            summary = evaluate_telemetry(payload)
+            self.assertEqual(summary["status"], "fail")
+            self.assertFalse(summary["ci_parity_ok"])
+            self.assertTrue(any(row["breach"] for row in summary["parity_checks"]))
+
+        def test_telemetry_validation_requires_replay_and_owner_fields(self) -> None:
+            invalid_event = self.sample_telemetry_event()
+            invalid_event.pop("owner_route")
+            with self.assertRaisesRegex(ValueError, "missing fields"):
+                evaluate_telemetry({"events": [invalid_event]})
 
-    def test_telemetry_validation_requires_replay_and_owner_fields(self) -> None:
-        invalid_event = self.sample_telemetry_event()
-        invalid_event.pop("owner_route")
-        with self.assertRaisesRegex(ValueError, "missing fields"):
-            evaluate_telemetry({"events": [invalid_event]})
+    return EvaluatorTests
 
 
 def run_self_test() -> int:
-    suite = unittest.defaultTestLoader.loadTestsFromTestCase(EvaluatorTests)
+    import unittest
+
+    suite = unittest.defaultTestLoader.loadTestsFromTestCase(_make_tests_class())
     result = unittest.TextTestRunner(verbosity=2).run(suite)
     return 0 if result.wasSuccessful() else 1
 
@@ -775,7 +845,7 @@ def main() -> int:
 
         output_path = Path(args.telemetry_output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(json.dumps(summary, indent=2, sort_keys=True), encoding="utf-8")
+        output_path.write_text(json.dumps(summary, indent=2, sort_keys=True) + "\n", encoding="utf-8")
         write_telemetry_log(Path(args.telemetry_log_output), summary, source_file=str(input_path))
         print(
             f"status={summary['status']} events={summary['event_count']} "
@@ -801,12 +871,12 @@ def main() -> int:
 
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(evaluations, indent=2, sort_keys=True), encoding="utf-8")
+    output_path.write_text(json.dumps(evaluations, indent=2, sort_keys=True) + "\n", encoding="utf-8")
 
     write_intake_log(Path(args.log_output), evaluations, source_file=str(input_path))
     print(
         f"evaluated={evaluations['candidate_count']} eligible={evaluations['eligible_count']} "
-        f"output={output_path}"
+        f"malformed={evaluations['malformed_count']} output={output_path}"
     )
     return 0
 
@@ -7,27 +7,60 @@ Usage:
     python3 scripts/quic_h3_triage.py --catalog            # list all catalog entries
     python3 scripts/quic_h3_triage.py --catalog --verbose  # catalog with repro commands
 
-No external dependencies -- stdlib only (json, sys, argparse, os).
+No external dependencies -- stdlib only (json, sys, argparse, functools, io, operator, os).
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
+import io
 import json
 import os
 import sys
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 
 # ============================================================================
 # Constants
 # ============================================================================
 
-_CATALOG_PATH = Path(__file__).resolve().parent.parent / "artifacts" / "quic_h3_replay_catalog_v1.json"
+@functools.cache
+def _catalog_path() -> Path:
+    """Resolve the replay catalog path on first use rather than at import."""
+    return Path(__file__).resolve().parent.parent / "artifacts" / "quic_h3_replay_catalog_v1.json"
+
 
 _SEPARATOR = "=" * 72
 _THIN_SEP = "-" * 72
+_SEPARATOR_LINE = _SEPARATOR + "\n"
+_THIN_SEP_LINE = _THIN_SEP + "\n"
+
+
+def _section_header(title: str) -> str:
+    return f"{_THIN_SEP_LINE}{title}\n{_THIN_SEP_LINE}"
+
+
+# Fixed report headers, pre-joined so each section opens with one write.
+_REPORT_HEADER = f"{_SEPARATOR_LINE}QUIC/H3 SCENARIO TRIAGE REPORT\n{_SEPARATOR_LINE}\n"
+_REPLAY_HEADER = _section_header("REPLAY COMMAND")
+_TRANSPORT_HEADER = _section_header("TRANSPORT SUMMARY")
+_H3_HEADER = _section_header("H3 SUMMARY")
+_VERDICTS_HEADER = _section_header("INVARIANT VERDICTS")
+_FINGERPRINT_HEADER = _section_header("FAILURE FINGERPRINT")
+_LIFECYCLE_HEADER = _section_header("CONNECTION LIFECYCLE TIMELINE")
+_TIMELINE_HEADER = _section_header("EVENT TIMELINE")
+_ARTIFACTS_HEADER = _section_header("ARTIFACT PATHS")
+
+_VERDICT_ICONS = {"pass": "[PASS]", "fail": "[FAIL]", "skip": "[SKIP]"}
+
+# u64::MAX, which the transport reports as ssthresh while still in slow start.
+_SSTHRESH_INF = (1 << 64) - 1
+
+# Sort key for (test file, entry) pairs in the catalog listing.
+_pair_file = itemgetter(0)
 
 
 # ============================================================================
@@ -35,11 +68,21 @@ _THIN_SEP = "-" * 72
 # ============================================================================
 
 def load_json(path: Path) -> dict[str, Any]:
-    """Load a JSON file and return the parsed dict."""
-    with path.open("r", encoding="utf-8") as fh:
-        return json.load(fh)
+    """Load a JSON file and return the parsed dict.
+
+    The raw bytes go straight to ``json.loads`` so the catalog is not first
+    materialised as a separate ``str``.
+    """
+    return json.loads(path.read_bytes())
+
 
+@functools.cache
+def _load_catalog() -> dict[str, Any]:
+    """Parse the replay catalog once per process; callers only read it."""
+    return load_json(_catalog_path())
 
+
+@functools.lru_cache(maxsize=1024)
 def fmt_us(us: int | None) -> str:
     """Format a microsecond value as a human-readable string."""
     if us is None:
@@ -51,176 +94,170 @@ def fmt_us(us: int | None) -> str:
     return f"{us / 1_000_000:.3f}s"
 
 
+# Reciprocals of powers of two are exact, so multiplying matches dividing.
+_INV_KIB = 1 / 1024
+_INV_MIB = 1 / (1024 * 1024)
+
+
+@functools.lru_cache(maxsize=256)
 def fmt_bytes(b: int) -> str:
     """Format a byte count as a human-readable string."""
     if b < 1024:
         return f"{b}B"
     if b < 1024 * 1024:
-        return f"{b / 1024:.1f}KB"
-    return f"{b / (1024 * 1024):.2f}MB"
+        return f"{b * _INV_KIB:.1f}KB"
+    return f"{b * _INV_MIB:.2f}MB"
 
 
 def print_manifest_report(manifest: dict[str, Any]) -> str:
     """Build a human-readable triage report from a scenario manifest dict."""
-    lines: list[str] = []
+    buf = io.StringIO()
+    write_manifest_report(manifest, buf)
+    return buf.getvalue()
+
+
+def write_manifest_report(manifest: dict[str, Any], out: TextIO) -> None:
+    """Write the triage report for a scenario manifest dict to ``out``."""
+    w = out.write
 
     # -- Header --
-    lines.append(_SEPARATOR)
-    lines.append("QUIC/H3 SCENARIO TRIAGE REPORT")
-    lines.append(_SEPARATOR)
-    lines.append("")
-
-    scenario_id = manifest.get("scenario_id", "UNKNOWN")
-    seed = manifest.get("seed", "?")
-    passed = manifest.get("passed", False)
-    duration_us = manifest.get("duration_us", 0)
-    failure_class = manifest.get("failure_class", "unknown")
+    w(_REPORT_HEADER)
+
+    mg = manifest.get
+    scenario_id = mg("scenario_id", "UNKNOWN")
+    seed = mg("seed", "?")
+    passed = mg("passed", False)
+    duration_us = mg("duration_us", 0)
+    failure_class = mg("failure_class", "unknown")
     status_str = "PASS" if passed else "FAIL"
 
-    lines.append(f"  Scenario:       {scenario_id}")
-    lines.append(f"  Seed:           {seed}")
-    lines.append(f"  Status:         {status_str}")
-    lines.append(f"  Failure class:  {failure_class}")
-    lines.append(f"  Duration:       {fmt_us(duration_us)}")
-    lines.append(f"  Schema:         {manifest.get('schema_id', 'n/a')} v{manifest.get('schema_version', '?')}")
-    lines.append(f"  Trace FP:       {manifest.get('trace_fingerprint', 'n/a')}")
-    lines.append("")
+    w(f"  Scenario:       {scenario_id}\n")
+    w(f"  Seed:           {seed}\n")
+    w(f"  Status:         {status_str}\n")
+    w(f"  Failure class:  {failure_class}\n")
+    w(f"  Duration:       {fmt_us(duration_us)}\n")
+    w(f"  Schema:         {mg('schema_id', 'n/a')} v{mg('schema_version', '?')}\n")
+    w(f"  Trace FP:       {mg('trace_fingerprint', 'n/a')}\n")
+    w("\n")
 
     # -- Replay command --
-    replay_cmd = manifest.get("replay_command", "")
+    replay_cmd = mg("replay_command", "")
     if replay_cmd:
-        lines.append(_THIN_SEP)
-        lines.append("REPLAY COMMAND")
-        lines.append(_THIN_SEP)
-        lines.append(f"  {replay_cmd}")
-        lines.append("")
+        w(_REPLAY_HEADER)
+        w(f"  {replay_cmd}\n")
+        w("\n")
 
     # -- Transport summary --
-    transport = manifest.get("transport_summary")
+    transport = mg("transport_summary")
     if transport:
-        lines.append(_THIN_SEP)
-        lines.append("TRANSPORT SUMMARY")
-        lines.append(_THIN_SEP)
-        lines.append(f"  Packets sent:    {transport.get('packets_sent', 0)}")
-        lines.append(f"  Packets acked:   {transport.get('packets_acked', 0)}")
-        lines.append(f"  Packets lost:    {transport.get('packets_lost', 0)}")
-        lines.append(f"  Bytes sent:      {fmt_bytes(transport.get('bytes_sent', 0))}")
-        lines.append(f"  Bytes acked:     {fmt_bytes(transport.get('bytes_acked', 0))}")
-        lines.append(f"  Bytes lost:      {fmt_bytes(transport.get('bytes_lost', 0))}")
-        lines.append(f"  Smoothed RTT:    {fmt_us(transport.get('smoothed_rtt_us'))}")
-        lines.append(f"  Min RTT:         {fmt_us(transport.get('min_rtt_us'))}")
-        lines.append(f"  CWND:            {fmt_bytes(transport.get('cwnd', 0))}")
-        ssthresh = transport.get("ssthresh", 0)
-        ssthresh_str = "inf (slow start)" if ssthresh == 18446744073709551615 else fmt_bytes(ssthresh)
-        lines.append(f"  SSThresh:        {ssthresh_str}")
-        lines.append(f"  PTO count:       {transport.get('pto_count', 0)}")
-        lines.append(f"  Final state:     {transport.get('final_state', 'unknown')}")
-        lines.append("")
+        w(_TRANSPORT_HEADER)
+        get = transport.get
+        w(f"  Packets sent:    {get('packets_sent', 0)}\n")
+        w(f"  Packets acked:   {get('packets_acked', 0)}\n")
+        w(f"  Packets lost:    {get('packets_lost', 0)}\n")
+        w(f"  Bytes sent:      {fmt_bytes(get('bytes_sent', 0))}\n")
+        w(f"  Bytes acked:     {fmt_bytes(get('bytes_acked', 0))}\n")
+        w(f"  Bytes lost:      {fmt_bytes(get('bytes_lost', 0))}\n")
+        w(f"  Smoothed RTT:    {fmt_us(get('smoothed_rtt_us'))}\n")
+        w(f"  Min RTT:         {fmt_us(get('min_rtt_us'))}\n")
+        w(f"  CWND:            {fmt_bytes(get('cwnd', 0))}\n")
+        ssthresh = get("ssthresh", 0)
+        ssthresh_str = "inf (slow start)" if ssthresh == _SSTHRESH_INF else fmt_bytes(ssthresh)
+        w(f"  SSThresh:        {ssthresh_str}\n")
+        w(f"  PTO count:       {get('pto_count', 0)}\n")
+        w(f"  Final state:     {get('final_state', 'unknown')}\n")
+        w("\n")
 
     # -- H3 summary --
-    h3 = manifest.get("h3_summary")
+    h3 = mg("h3_summary")
     if h3:
-        lines.append(_THIN_SEP)
-        lines.append("H3 SUMMARY")
-        lines.append(_THIN_SEP)
-        lines.append(f"  Requests sent:       {h3.get('requests_sent', 0)}")
-        lines.append(f"  Responses received:  {h3.get('responses_received', 0)}")
-        lines.append(f"  Streams opened:      {h3.get('streams_opened', 0)}")
-        lines.append(f"  Streams reset:       {h3.get('streams_reset', 0)}")
-        goaway_id = h3.get("goaway_id")
-        lines.append(f"  GOAWAY ID:           {goaway_id if goaway_id is not None else 'none'}")
-        lines.append(f"  Settings exchanged:  {h3.get('settings_exchanged', False)}")
-        lines.append(f"  Protocol errors:     {h3.get('protocol_errors', 0)}")
-        lines.append("")
+        w(_H3_HEADER)
+        get = h3.get
+        w(f"  Requests sent:       {get('requests_sent', 0)}\n")
+        w(f"  Responses received:  {get('responses_received', 0)}\n")
+        w(f"  Streams opened:      {get('streams_opened', 0)}\n")
+        w(f"  Streams reset:       {get('streams_reset', 0)}\n")
+        goaway_id = get("goaway_id")
+        w(f"  GOAWAY ID:           {goaway_id if goaway_id is not None else 'none'}\n")
+        w(f"  Settings exchanged:  {get('settings_exchanged', False)}\n")
+        w(f"  Protocol errors:     {get('protocol_errors', 0)}\n")
+        w("\n")
 
     # -- Invariant verdicts --
-    verdicts = manifest.get("invariant_verdicts", [])
+    verdicts = mg("invariant_verdicts", [])
     if verdicts:
-        lines.append(_THIN_SEP)
-        lines.append("INVARIANT VERDICTS")
-        lines.append(_THIN_SEP)
+        w(_VERDICTS_HEADER)
         for v in verdicts:
-            inv_id = v.get("invariant_id", "?")
-            verdict = v.get("verdict", "?")
-            details = v.get("details", "")
-            icon = {"pass": "[PASS]", "fail": "[FAIL]", "skip": "[SKIP]"}.get(
-                verdict, f"[{verdict.upper()}]"
-            )
-            lines.append(f"  {icon} {inv_id}")
+            get = v.get
+            inv_id = get("invariant_id", "?")
+            verdict = get("verdict", "?")
+            details = get("details", "")
+            icon = _VERDICT_ICONS.get(verdict) or f"[{verdict.upper()}]"
+            w(f"  {icon} {inv_id}\n")
             if details:
-                lines.append(f"         {details}")
-        lines.append("")
+                w(f"         {details}\n")
+        w("\n")
 
     # -- Failure fingerprint --
-    fp = manifest.get("failure_fingerprint")
+    fp = mg("failure_fingerprint")
     if fp:
-        lines.append(_THIN_SEP)
-        lines.append("FAILURE FINGERPRINT")
-        lines.append(_THIN_SEP)
-        lines.append(f"  Bucket:          {fp.get('bucket', 'unknown')}")
-        assertion = fp.get("assertion")
+        w(_FINGERPRINT_HEADER)
+        get = fp.get
+        w(f"  Bucket:          {get('bucket', 'unknown')}\n")
+        assertion = get("assertion")
         if assertion:
-            lines.append(f"  Assertion:       {assertion}")
-        bt_hash = fp.get("backtrace_hash")
+            w(f"  Assertion:       {assertion}\n")
+        bt_hash = get("backtrace_hash")
         if bt_hash:
-            lines.append(f"  Backtrace hash:  {bt_hash}")
-        last_event = fp.get("last_event_before_failure")
+            w(f"  Backtrace hash:  {bt_hash}\n")
+        last_event = get("last_event_before_failure")
         if last_event:
-            lines.append(f"  Last event:      {json.dumps(last_event, separators=(',', ':'))}")
-        lines.append("")
+            w(f"  Last event:      {json.dumps(last_event, separators=(',', ':'))}\n")
+        w("\n")
 
     # -- Connection lifecycle timeline --
-    lifecycle = manifest.get("connection_lifecycle", [])
+    lifecycle = mg("connection_lifecycle", [])
     if lifecycle:
-        lines.append(_THIN_SEP)
-        lines.append("CONNECTION LIFECYCLE TIMELINE")
-        lines.append(_THIN_SEP)
+        w(_LIFECYCLE_HEADER)
         for transition in lifecycle:
-            from_s = transition.get("from_state", "?")
-            to_s = transition.get("to_state", "?")
-            ts = transition.get("ts_us", 0)
-            trigger = transition.get("trigger", "?")
-            lines.append(f"  [{fmt_us(ts):>10s}] {from_s} -> {to_s}  (trigger: {trigger})")
-        lines.append("")
+            get = transition.get
+            from_s = get("from_state", "?")
+            to_s = get("to_state", "?")
+            ts = get("ts_us", 0)
+            trigger = get("trigger", "?")
+            w(f"  [{fmt_us(ts):>10s}] {from_s} -> {to_s}  (trigger: {trigger})\n")
+        w("\n")
 
     # -- Event timeline --
-    timeline = manifest.get("event_timeline")
+    timeline = mg("event_timeline")
     if timeline:
-        lines.append(_THIN_SEP)
-        lines.append("EVENT TIMELINE")
-        lines.append(_THIN_SEP)
-        lines.append(f"  Total events:  {timeline.get('total_events', 0)}")
-        by_cat = timeline.get("by_category", {})
-        if by_cat:
-            lines.append("  By category:")
-            for cat, count in sorted(by_cat.items()):
-                lines.append(f"    {cat}: {count}")
-        by_lvl = timeline.get("by_level", {})
-        if by_lvl:
-            lines.append("  By level:")
-            for lvl, count in sorted(by_lvl.items()):
-                lines.append(f"    {lvl}: {count}")
-        lines.append("")
+        w(_TIMELINE_HEADER)
+        get = timeline.get
+        w(f"  Total events:  {get('total_events', 0)}\n")
+        for heading, counts in (
+            ("  By category:\n", get("by_category", {})),
+            ("  By level:\n", get("by_level", {})),
+        ):
+            if counts:
+                w(heading)
+                w("".join(f"    {name}: {count}\n" for name, count in sorted(counts.items())))
+        w("\n")
 
     # -- Profile tags --
-    tags = manifest.get("profile_tags", [])
+    tags = mg("profile_tags", [])
     if tags:
-        lines.append(f"  Profile tags: {', '.join(tags)}")
-        lines.append("")
+        w(f"  Profile tags: {', '.join(tags)}\n")
+        w("\n")
 
     # -- Artifact paths --
-    artifacts = manifest.get("artifact_paths", [])
+    artifacts = mg("artifact_paths", [])
     if artifacts:
-        lines.append(_THIN_SEP)
-        lines.append("ARTIFACT PATHS")
-        lines.append(_THIN_SEP)
+        w(_ARTIFACTS_HEADER)
         for p in artifacts:
-            lines.append(f"  {p}")
-        lines.append("")
+            w(f"  {p}\n")
+        w("\n")
 
-    lines.append(_SEPARATOR)
-
-    return "\n".join(lines)
+    w(_SEPARATOR)
 
 
 # ============================================================================
@@ -229,32 +266,41 @@ def print_manifest_report(manifest: dict[str, Any]) -> str:
 
 def print_catalog(verbose: bool = False) -> str:
     """Load the replay catalog and build a human-readable listing."""
-    if not _CATALOG_PATH.exists():
-        return f"ERROR: catalog not found at {_CATALOG_PATH}"
+    catalog_path = _catalog_path()
+    if not catalog_path.exists():
+        return f"ERROR: catalog not found at {catalog_path}"
 
-    catalog = load_json(_CATALOG_PATH)
+    catalog = _load_catalog()
     entries = catalog.get("entries", [])
 
-    lines: list[str] = []
-    lines.append(_SEPARATOR)
-    lines.append(f"QUIC/H3 REPLAY CATALOG ({len(entries)} scenarios)")
-    lines.append(f"  Schema:  {catalog.get('schema_version', '?')}")
-    lines.append(f"  Generated: {catalog.get('generated_at_utc', '?')}")
-    lines.append(_SEPARATOR)
-    lines.append("")
-
-    # Group entries by test file.
+    buf = io.StringIO()
+    w = buf.write
+    w(_SEPARATOR_LINE)
+    w(f"QUIC/H3 REPLAY CATALOG ({len(entries)} scenarios)\n")
+    w(f"  Schema:  {catalog.get('schema_version', '?')}\n")
+    w(f"  Generated: {catalog.get('generated_at_utc', '?')}\n")
+    w(_SEPARATOR_LINE)
+    w("\n")
+
+    # Group entries by test file. The (test file, entry) pairs are sorted
+    # once up front; the sort is stable, so entries keep catalog order
+    # within a file and the plain dict comes out already in file order.
     by_file: dict[str, list[dict[str, Any]]] = {}
-    for entry in entries:
-        test_files = entry.get("test_files", ["unknown"])
-        for tf in test_files:
-            by_file.setdefault(tf, []).append(entry)
-
-    for tf in sorted(by_file.keys()):
-        file_entries = by_file[tf]
-        lines.append(_THIN_SEP)
-        lines.append(f"  {tf} ({len(file_entries)} tests)")
-        lines.append(_THIN_SEP)
+    pairs = [
+        (tf, entry)
+        for entry in entries
+        for tf in entry.get("test_files", ["unknown"])
+    ]
+    pairs.sort(key=_pair_file)
+    for tf, entry in pairs:
+        if (file_entries := by_file.get(tf)) is None:
+            by_file[tf] = file_entries = []
+        file_entries.append(entry)
+
+    for tf, file_entries in by_file.items():
+        w(_THIN_SEP_LINE)
+        w(f"  {tf} ({len(file_entries)} tests)\n")
+        w(_THIN_SEP_LINE)
 
         for entry in file_entries:
             funcs = entry.get("test_functions", [])
@@ -264,24 +310,24 @@ def print_catalog(verbose: bool = False) -> str:
             seed = entry.get("seed", "?")
             outcome = entry.get("expected_outcome", "?")
 
-            lines.append(f"  {entry.get('scenario_id', '?')}")
-            lines.append(f"    Function:  {func_str}")
-            lines.append(f"    Seed:      {seed}")
-            lines.append(f"    Outcome:   {outcome}")
-            lines.append(f"    Tags:      {tag_str}")
+            w(f"  {entry.get('scenario_id', '?')}\n")
+            w(f"    Function:  {func_str}\n")
+            w(f"    Seed:      {seed}\n")
+            w(f"    Outcome:   {outcome}\n")
+            w(f"    Tags:      {tag_str}\n")
 
             if verbose:
                 repro_cmd = entry.get("repro_cmd", "")
                 if repro_cmd:
-                    lines.append(f"    Repro:     {repro_cmd}")
+                    w(f"    Repro:     {repro_cmd}\n")
 
-            lines.append("")
+            w("\n")
 
-    lines.append(_SEPARATOR)
-    lines.append(f"Total: {len(entries)} entries across {len(by_file)} test files")
-    lines.append(_SEPARATOR)
+    w(_SEPARATOR_LINE)
+    w(f"Total: {len(entries)} entries across {len(by_file)} test files\n")
+    w(_SEPARATOR)
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 # ============================================================================
@@ -337,8 +383,8 @@ def main(argv: list[str] | None = None) -> int:
         return 1
 
     manifest = load_json(manifest_path)
-    report = print_manifest_report(manifest)
-    print(report)
+    write_manifest_report(manifest, sys.stdout)
+    sys.stdout.write("\n")
     return 0
 
 
@@ -430,14 +476,16 @@ def test_triage_output() -> None:
     assert "FAILURE FINGERPRINT" not in report, "should not have fingerprint on pass"
 
     # Verify a failing manifest includes failure fingerprint.
-    fail_manifest = dict(sample_manifest)
-    fail_manifest["passed"] = False
-    fail_manifest["failure_class"] = "assertion_failure"
-    fail_manifest["failure_fingerprint"] = {
-        "bucket": "assertion_failure",
-        "assertion": "expected 42 got 43",
-        "backtrace_hash": None,
-        "last_event_before_failure": {"type": "PacketSent", "pn_space": "initial"},
+    fail_manifest = {
+        **sample_manifest,
+        "passed": False,
+        "failure_class": "assertion_failure",
+        "failure_fingerprint": {
+            "bucket": "assertion_failure",
+            "assertion": "expected 42 got 43",
+            "backtrace_hash": None,
+            "last_event_before_failure": {"type": "PacketSent", "pn_space": "initial"},
+        },
     }
 
     fail_report = print_manifest_report(fail_manifest)
@@ -447,7 +495,7 @@ def test_triage_output() -> None:
     assert "expected 42 got 43" in fail_report, "missing assertion text"
 
     # Verify catalog listing (if catalog file exists).
-    if _CATALOG_PATH.exists():
+    if _catalog_path().exists():
         catalog_report = print_catalog(verbose=False)
         assert "QUIC/H3 REPLAY CATALOG" in catalog_report, "missing catalog header"
         assert "72 scenarios" in catalog_report, "missing correct entry count"
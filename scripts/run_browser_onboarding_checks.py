@@ -16,21 +16,27 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import shlex
 import subprocess
 import sys
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Iterable
+from typing import Iterator, NamedTuple
 
 
 def now_iso() -> str:
     return datetime.now(UTC).isoformat()
 
 
-@dataclass(frozen=True)
-class Step:
+# Dry runs execute nothing, so their artifacts carry a fixed timestamp and
+# stay reproducible byte for byte.
+_DRY_RUN_TS = "1970-01-01T00:00:00+00:00"
+
+
+class Step(NamedTuple):
     step_id: str
     command: str
     remediation_hint: str
@@ -40,6 +46,26 @@ class Step:
     diagnostic_category: str = "onboarding"
     coverage_kind: str = "policy"
     trace_artifact_hint: str = ""
+    # What actually runs: command is only the shell-form display/repro string.
+    argv: tuple[str, ...] = ()
+    env: dict[str, str] | None = None
+
+
+def command_step(step_id: str, command: str, remediation_hint: str, **fields: str) -> Step:
+    """Step for a plain command with no variable expansion."""
+    return Step(step_id, command, remediation_hint, **fields, argv=tuple(shlex.split(command)))
+
+
+def consumer_script_step(step_id: str, script: str, remediation_hint: str, **fields: str) -> Step:
+    """Step running a consumer fixture script with /usr/bin first on PATH."""
+    return Step(
+        step_id,
+        f"PATH=/usr/bin:$PATH bash {script}",
+        remediation_hint,
+        **fields,
+        argv=("bash", script),
+        env={"PATH": f"/usr/bin:{os.environ.get('PATH', '')}"},
+    )
 
 
 def rch_cargo_command(target_slug: str, cargo_args: str) -> str:
@@ -51,9 +77,28 @@ def rch_cargo_command(target_slug: str, cargo_args: str) -> str:
     )
 
 
+def rch_cargo_step(
+    step_id: str, target_slug: str, cargo_args: str, remediation_hint: str, **fields: str
+) -> Step:
+    """Step running cargo through rch with a per-step target dir."""
+    target_dir = (
+        f"{os.environ.get('TMPDIR') or '/tmp'}/rch_target_browser_onboarding_{target_slug}"
+    )
+    return Step(
+        step_id,
+        rch_cargo_command(target_slug, cargo_args),
+        remediation_hint,
+        **fields,
+        argv=(
+            "rch", "exec", "--", "env", f"CARGO_TARGET_DIR={target_dir}",
+            "cargo", *cargo_args.split(),
+        ),
+    )
+
+
 SCENARIOS: dict[str, list[Step]] = {
     "vanilla": [
-        Step(
+        command_step(
             "vanilla.typescript_type_model",
             "python3 scripts/check_wasm_typescript_type_model_policy.py "
             "--policy .github/wasm_typescript_type_model_policy.json "
@@ -64,7 +109,7 @@ SCENARIOS: dict[str, list[Step]] = {
             runtime_profile="FP-BR-DEV",
             diagnostic_category="type_model",
         ),
-        Step(
+        command_step(
             "vanilla.typescript_package_topology",
             "python3 scripts/check_wasm_typescript_package_policy.py "
             "--policy .github/wasm_typescript_package_policy.json "
@@ -76,9 +121,9 @@ SCENARIOS: dict[str, list[Step]] = {
             runtime_profile="FP-BR-DEV",
             diagnostic_category="package_topology",
         ),
-        Step(
+        consumer_script_step(
             "vanilla.storage_artifact_bundle",
-            "PATH=/usr/bin:$PATH bash scripts/validate_vite_vanilla_consumer.sh",
+            "scripts/validate_vite_vanilla_consumer.sh",
             "Restage package outputs or inspect the maintained vanilla consumer fixture when BrowserStorage or BrowserArtifactStore bundle markers drift.",
             package_entrypoint="@asupersync/browser",
             adapter_path="none",
@@ -87,37 +132,31 @@ SCENARIOS: dict[str, list[Step]] = {
             coverage_kind="behavioral",
             trace_artifact_hint="target/e2e-results/vite_vanilla_consumer/<timestamp>/summary.json",
         ),
-        Step(
+        rch_cargo_step(
             "vanilla.browser_ready_handoff",
-            rch_cargo_command(
-                "vanilla_browser_ready_handoff",
-                "test -p asupersync browser_ready_handoff -- --nocapture",
-            ),
+            "vanilla_browser_ready_handoff",
+            "test -p asupersync browser_ready_handoff -- --nocapture",
             "Inspect scheduler fairness/handoff regressions in src/runtime/scheduler/three_lane.rs.",
             package_entrypoint="@asupersync/browser",
             adapter_path="none",
             runtime_profile="FP-BR-DEV",
             diagnostic_category="runtime_handoff",
         ),
-        Step(
+        rch_cargo_step(
             "vanilla.quiescence",
-            rch_cargo_command(
-                "vanilla_quiescence",
-                "test --test close_quiescence_regression "
-                "browser_nested_cancel_cascade_reaches_quiescence -- --nocapture",
-            ),
+            "vanilla_quiescence",
+            "test --test close_quiescence_regression "
+            "browser_nested_cancel_cascade_reaches_quiescence -- --nocapture",
             "Verify region close drains cancellation/finalizers before close acknowledgement.",
             package_entrypoint="@asupersync/browser",
             adapter_path="none",
             runtime_profile="FP-BR-DEV",
             diagnostic_category="quiescence",
         ),
-        Step(
+        rch_cargo_step(
             "vanilla.security_policy",
-            rch_cargo_command(
-                "vanilla_security_policy",
-                "test --test security_invariants browser_fetch_security -- --nocapture",
-            ),
+            "vanilla_security_policy",
+            "test --test security_invariants browser_fetch_security -- --nocapture",
             "Review browser fetch capability defaults and allowlist policy in src/io/cap.rs.",
             package_entrypoint="@asupersync/browser",
             adapter_path="none",
@@ -126,13 +165,11 @@ SCENARIOS: dict[str, list[Step]] = {
             coverage_kind="behavioral",
             trace_artifact_hint="artifacts/onboarding/vanilla.security_policy.log",
         ),
-        Step(
+        rch_cargo_step(
             "vanilla.behavior_loser_drain_replay",
-            rch_cargo_command(
-                "vanilla_behavior_loser_drain_replay",
-                "test --test e2e_combinator "
-                "browser_spork_harness_deterministic_replay -- --nocapture",
-            ),
+            "vanilla_behavior_loser_drain_replay",
+            "test --test e2e_combinator "
+            "browser_spork_harness_deterministic_replay -- --nocapture",
             "Investigate browser loser-drain replay determinism regressions in tests/e2e/combinator/cancel_correctness/browser_loser_drain.rs.",
             package_entrypoint="@asupersync/browser",
             adapter_path="none",
@@ -141,13 +178,11 @@ SCENARIOS: dict[str, list[Step]] = {
             coverage_kind="behavioral",
             trace_artifact_hint="artifacts/onboarding/vanilla.behavior_loser_drain_replay.log",
         ),
-        Step(
+        rch_cargo_step(
             "vanilla.negative_skipped_loser_detection",
-            rch_cargo_command(
-                "vanilla_negative_skipped_loser_detection",
-                "test --test e2e_combinator "
-                "browser_oracle_detects_skipped_loser -- --nocapture",
-            ),
+            "vanilla_negative_skipped_loser_detection",
+            "test --test e2e_combinator "
+            "browser_oracle_detects_skipped_loser -- --nocapture",
             "Ensure loser-drain oracle violations are surfaced with deterministic diagnostics.",
             package_entrypoint="@asupersync/browser",
             adapter_path="none",
@@ -156,13 +191,11 @@ SCENARIOS: dict[str, list[Step]] = {
             coverage_kind="negative",
             trace_artifact_hint="artifacts/onboarding/vanilla.negative_skipped_loser_detection.log",
         ),
-        Step(
+        rch_cargo_step(
             "vanilla.timing_mid_computation_drain",
-            rch_cargo_command(
-                "vanilla_timing_mid_computation_drain",
-                "test --test e2e_combinator "
-                "browser_mid_computation_task_drained_on_region_close -- --nocapture",
-            ),
+            "vanilla_timing_mid_computation_drain",
+            "test --test e2e_combinator "
+            "browser_mid_computation_task_drained_on_region_close -- --nocapture",
             "Verify mid-computation cancellation drains under browser-style cooperative scheduling.",
             package_entrypoint="@asupersync/browser",
             adapter_path="none",
@@ -171,13 +204,11 @@ SCENARIOS: dict[str, list[Step]] = {
             coverage_kind="timing_stress",
             trace_artifact_hint="artifacts/onboarding/vanilla.timing_mid_computation_drain.log",
         ),
-        Step(
+        rch_cargo_step(
             "vanilla.lifecycle_tab_suspension_multi_obligation",
-            rch_cargo_command(
-                "vanilla_lifecycle_tab_suspension_multi_obligation",
-                "test --test obligation_wasm_parity "
-                "wasm_host_interruption_tab_suspension_multi_obligation -- --nocapture",
-            ),
+            "vanilla_lifecycle_tab_suspension_multi_obligation",
+            "test --test obligation_wasm_parity "
+            "wasm_host_interruption_tab_suspension_multi_obligation -- --nocapture",
             "Investigate lifecycle chaos drift for multi-obligation tab suspension handling.",
             package_entrypoint="@asupersync/browser",
             adapter_path="none",
@@ -186,13 +217,11 @@ SCENARIOS: dict[str, list[Step]] = {
             coverage_kind="lifecycle_chaos",
             trace_artifact_hint="artifacts/onboarding/vanilla.lifecycle_tab_suspension_multi_obligation.log",
         ),
-        Step(
+        rch_cargo_step(
             "vanilla.lifecycle_suspend_resume_cancel_drain",
-            rch_cargo_command(
-                "vanilla_lifecycle_suspend_resume_cancel_drain",
-                "test --test obligation_wasm_parity "
-                "wasm_host_interruption_during_cancel_drain -- --nocapture",
-            ),
+            "vanilla_lifecycle_suspend_resume_cancel_drain",
+            "test --test obligation_wasm_parity "
+            "wasm_host_interruption_during_cancel_drain -- --nocapture",
             "Verify suspend/resume cancel-drain path stays leak-free under lifecycle interruption.",
             package_entrypoint="@asupersync/browser",
             adapter_path="none",
@@ -203,7 +232,7 @@ SCENARIOS: dict[str, list[Step]] = {
         ),
     ],
     "react": [
-        Step(
+        command_step(
             "react.typescript_type_model",
             "python3 scripts/check_wasm_typescript_type_model_policy.py "
             "--policy .github/wasm_typescript_type_model_policy.json "
@@ -214,7 +243,7 @@ SCENARIOS: dict[str, list[Step]] = {
             runtime_profile="FP-BR-DEV",
             diagnostic_category="type_model",
         ),
-        Step(
+        command_step(
             "react.typescript_package_topology",
             "python3 scripts/check_wasm_typescript_package_policy.py "
             "--policy .github/wasm_typescript_package_policy.json "
@@ -226,39 +255,33 @@ SCENARIOS: dict[str, list[Step]] = {
             runtime_profile="FP-BR-DEV",
             diagnostic_category="package_topology",
         ),
-        Step(
+        rch_cargo_step(
             "react.clock_start_zero",
-            rch_cargo_command(
-                "react_clock_start_zero",
-                "test --test native_seam_parity "
-                "browser_clock_through_trait_starts_at_zero -- --nocapture",
-            ),
+            "react_clock_start_zero",
+            "test --test native_seam_parity "
+            "browser_clock_through_trait_starts_at_zero -- --nocapture",
             "Check BrowserMonotonicClock bootstrap semantics and time source trait wiring.",
             package_entrypoint="@asupersync/react",
             adapter_path="react/provider",
             runtime_profile="FP-BR-DEV",
             diagnostic_category="adapter_lifecycle",
         ),
-        Step(
+        rch_cargo_step(
             "react.clock_advances",
-            rch_cargo_command(
-                "react_clock_advances",
-                "test --test native_seam_parity "
-                "browser_clock_through_trait_advances_with_host_samples -- --nocapture",
-            ),
+            "react_clock_advances",
+            "test --test native_seam_parity "
+            "browser_clock_through_trait_advances_with_host_samples -- --nocapture",
             "Check monotonic clamp policy and host-sample advancement path for browser clock.",
             package_entrypoint="@asupersync/react",
             adapter_path="react/provider",
             runtime_profile="FP-BR-DEV",
             diagnostic_category="adapter_lifecycle",
         ),
-        Step(
+        rch_cargo_step(
             "react.obligation_lifecycle",
-            rch_cargo_command(
-                "react_obligation_lifecycle",
-                "test --test obligation_wasm_parity "
-                "wasm_full_browser_lifecycle_simulation -- --nocapture",
-            ),
+            "react_obligation_lifecycle",
+            "test --test obligation_wasm_parity "
+            "wasm_full_browser_lifecycle_simulation -- --nocapture",
             "Inspect obligation drain/commit lifecycle invariants in tests/obligation_wasm_parity.rs.",
             package_entrypoint="@asupersync/react",
             adapter_path="react/provider",
@@ -267,13 +290,11 @@ SCENARIOS: dict[str, list[Step]] = {
             coverage_kind="behavioral",
             trace_artifact_hint="artifacts/onboarding/react.obligation_lifecycle.log",
         ),
-        Step(
+        rch_cargo_step(
             "react.behavior_strict_mode_double_invocation",
-            rch_cargo_command(
-                "react_behavior_strict_mode_double_invocation",
-                "test --test react_wasm_strictmode_harness "
-                "strict_mode_double_invocation_is_leak_free_and_cancel_correct -- --nocapture",
-            ),
+            "react_behavior_strict_mode_double_invocation",
+            "test --test react_wasm_strictmode_harness "
+            "strict_mode_double_invocation_is_leak_free_and_cancel_correct -- --nocapture",
             "Fix React strict-mode lifecycle leaks or cancel/join sequencing drift.",
             package_entrypoint="@asupersync/react",
             adapter_path="react/provider",
@@ -282,13 +303,11 @@ SCENARIOS: dict[str, list[Step]] = {
             coverage_kind="behavioral",
             trace_artifact_hint="artifacts/onboarding/react.behavior_strict_mode_double_invocation.log",
         ),
-        Step(
+        rch_cargo_step(
             "react.timing_restart_churn",
-            rch_cargo_command(
-                "react_timing_restart_churn",
-                "test --test react_wasm_strictmode_harness "
-                "rapid_restart_churn_keeps_event_sequence_balanced -- --nocapture",
-            ),
+            "react_timing_restart_churn",
+            "test --test react_wasm_strictmode_harness "
+            "rapid_restart_churn_keeps_event_sequence_balanced -- --nocapture",
             "Investigate restart-churn race regressions in React adapter task cancellation/join sequencing.",
             package_entrypoint="@asupersync/react",
             adapter_path="react/provider",
@@ -297,13 +316,11 @@ SCENARIOS: dict[str, list[Step]] = {
             coverage_kind="timing_stress",
             trace_artifact_hint="artifacts/onboarding/react.timing_restart_churn.log",
         ),
-        Step(
+        rch_cargo_step(
             "react.lifecycle_background_throttle_suspend_resume",
-            rch_cargo_command(
-                "react_lifecycle_background_throttle_suspend_resume",
-                "test --test react_wasm_strictmode_harness "
-                "lifecycle_background_throttle_suspend_resume_navigation_churn_is_deterministic -- --nocapture",
-            ),
+            "react_lifecycle_background_throttle_suspend_resume",
+            "test --test react_wasm_strictmode_harness "
+            "lifecycle_background_throttle_suspend_resume_navigation_churn_is_deterministic -- --nocapture",
             "Investigate React lifecycle chaos regressions across background throttle, suspend/resume, and navigation churn.",
             package_entrypoint="@asupersync/react",
             adapter_path="react/provider",
@@ -314,13 +331,11 @@ SCENARIOS: dict[str, list[Step]] = {
         ),
     ],
     "worker": [
-        Step(
+        rch_cargo_step(
             "worker.runtime_support_matrix",
-            rch_cargo_command(
-                "worker_runtime_support_matrix",
-                "test --test wasm_browser_feasibility_matrix "
-                "dedicated_worker_ -- --nocapture",
-            ),
+            "worker_runtime_support_matrix",
+            "test --test wasm_browser_feasibility_matrix "
+            "dedicated_worker_ -- --nocapture",
             "Inspect dedicated-worker support classification drift across packages/browser/src/index.ts, docs/WASM.md, and docs/integration.md.",
             package_entrypoint="@asupersync/browser",
             adapter_path="worker/bootstrap",
@@ -329,13 +344,11 @@ SCENARIOS: dict[str, list[Step]] = {
             coverage_kind="behavioral",
             trace_artifact_hint="artifacts/onboarding/worker.runtime_support_matrix.log",
         ),
-        Step(
+        rch_cargo_step(
             "worker.sdk_runtime_diagnostics",
-            rch_cargo_command(
-                "worker_sdk_runtime_diagnostics",
-                "test --test wasm_js_exports_coverage_contract "
-                "browser_src_index_ -- --nocapture",
-            ),
+            "worker_sdk_runtime_diagnostics",
+            "test --test wasm_js_exports_coverage_contract "
+            "browser_src_index_ -- --nocapture",
             "Verify dedicated-worker runtime diagnostics and actionable guidance in packages/browser/src/index.ts.",
             package_entrypoint="@asupersync/browser",
             adapter_path="worker/bootstrap",
@@ -344,13 +357,11 @@ SCENARIOS: dict[str, list[Step]] = {
             coverage_kind="behavioral",
             trace_artifact_hint="artifacts/onboarding/worker.sdk_runtime_diagnostics.log",
         ),
-        Step(
+        rch_cargo_step(
             "worker.storage_artifact_diagnostics",
-            rch_cargo_command(
-                "worker_storage_artifact_diagnostics",
-                "test --test wasm_js_exports_coverage_contract "
-                "browser_src_index_exposes_storage_and_artifact_diagnostics -- --nocapture",
-            ),
+            "worker_storage_artifact_diagnostics",
+            "test --test wasm_js_exports_coverage_contract "
+            "browser_src_index_exposes_storage_and_artifact_diagnostics -- --nocapture",
             "Verify BrowserStorage and BrowserArtifactStore failure diagnostics, cleanup flows, and worker download guidance in packages/browser/src/index.ts.",
             package_entrypoint="@asupersync/browser",
             adapter_path="worker/bootstrap",
@@ -359,13 +370,11 @@ SCENARIOS: dict[str, list[Step]] = {
             coverage_kind="behavioral",
             trace_artifact_hint="artifacts/onboarding/worker.storage_artifact_diagnostics.log",
         ),
-        Step(
+        rch_cargo_step(
             "worker.fetch_host_bridge",
-            rch_cargo_command(
-                "worker_fetch_host_bridge",
-                "test --test wasm_js_exports_coverage_contract "
-                "browser_core_fetch_bridge_supports_window_or_worker_hosts -- --nocapture",
-            ),
+            "worker_fetch_host_bridge",
+            "test --test wasm_js_exports_coverage_contract "
+            "browser_core_fetch_bridge_supports_window_or_worker_hosts -- --nocapture",
             "Confirm browser-core fetch host wiring still accepts dedicated-worker globals when window is unavailable.",
             package_entrypoint="@asupersync/browser",
             adapter_path="worker/bootstrap",
@@ -374,12 +383,10 @@ SCENARIOS: dict[str, list[Step]] = {
             coverage_kind="behavioral",
             trace_artifact_hint="artifacts/onboarding/worker.fetch_host_bridge.log",
         ),
-        Step(
+        rch_cargo_step(
             "worker.coordinator_protocol",
-            rch_cargo_command(
-                "worker_coordinator_protocol",
-                "test --lib worker_channel::tests::coordinator_ -- --nocapture",
-            ),
+            "worker_coordinator_protocol",
+            "test --lib worker_channel::tests::coordinator_ -- --nocapture",
             "Investigate worker coordination protocol regressions in src/net/worker_channel.rs before touching browser-side bootstrap code.",
             package_entrypoint="@asupersync/browser",
             adapter_path="worker/bootstrap",
@@ -388,9 +395,9 @@ SCENARIOS: dict[str, list[Step]] = {
             coverage_kind="behavioral",
             trace_artifact_hint="artifacts/onboarding/worker.coordinator_protocol.log",
         ),
-        Step(
+        consumer_script_step(
             "worker.storage_artifact_export_handoff",
-            "PATH=/usr/bin:$PATH bash scripts/validate_dedicated_worker_consumer.sh",
+            "scripts/validate_dedicated_worker_consumer.sh",
             "Rebuild or restage package artifacts if the maintained dedicated-worker consumer fixture cannot bundle the storage/export handoff path cleanly.",
             package_entrypoint="@asupersync/browser",
             adapter_path="worker/bootstrap",
@@ -401,13 +408,11 @@ SCENARIOS: dict[str, list[Step]] = {
         ),
     ],
     "shared_worker": [
-        Step(
+        rch_cargo_step(
             "shared_worker.support_matrix",
-            rch_cargo_command(
-                "shared_worker_support_matrix",
-                "test --test wasm_browser_feasibility_matrix "
-                "shared_worker_ -- --nocapture",
-            ),
+            "shared_worker_support_matrix",
+            "test --test wasm_browser_feasibility_matrix "
+            "shared_worker_ -- --nocapture",
             "Inspect shared-worker fail-closed and bounded coordinator contract drift across docs, onboarding, and package helpers.",
             package_entrypoint="@asupersync/browser",
             adapter_path="shared_worker/coordinator",
@@ -416,9 +421,9 @@ SCENARIOS: dict[str, list[Step]] = {
             coverage_kind="behavioral",
             trace_artifact_hint="artifacts/onboarding/shared_worker.support_matrix.log",
         ),
-        Step(
+        consumer_script_step(
             "shared_worker.coordinator_fixture",
-            "PATH=/usr/bin:$PATH bash scripts/validate_shared_worker_consumer.sh",
+            "scripts/validate_shared_worker_consumer.sh",
             "Rebuild or restage package artifacts if the maintained shared-worker consumer fixture cannot bundle or replay the bounded coordinator attach/reuse/fallback path cleanly.",
             package_entrypoint="@asupersync/browser",
             adapter_path="shared_worker/coordinator",
@@ -429,7 +434,7 @@ SCENARIOS: dict[str, list[Step]] = {
         ),
     ],
     "next": [
-        Step(
+        command_step(
             "next.typescript_type_model",
             "python3 scripts/check_wasm_typescript_type_model_policy.py "
             "--policy .github/wasm_typescript_type_model_policy.json "
@@ -440,7 +445,7 @@ SCENARIOS: dict[str, list[Step]] = {
             runtime_profile="FP-BR-DEV",
             diagnostic_category="type_model",
         ),
-        Step(
+        command_step(
             "next.typescript_package_topology",
             "python3 scripts/check_wasm_typescript_package_policy.py "
             "--policy .github/wasm_typescript_package_policy.json "
@@ -452,7 +457,7 @@ SCENARIOS: dict[str, list[Step]] = {
             runtime_profile="FP-BR-DEV",
             diagnostic_category="package_topology",
         ),
-        Step(
+        command_step(
             "next.dependency_policy",
             "python3 scripts/check_wasm_dependency_policy.py "
             "--policy .github/wasm_dependency_policy.json",
@@ -462,25 +467,21 @@ SCENARIOS: dict[str, list[Step]] = {
             runtime_profile="FP-BR-DEV",
             diagnostic_category="dependency_policy",
         ),
-        Step(
+        rch_cargo_step(
             "next.wasm_profile_check",
-            rch_cargo_command(
-                "next_wasm_profile_check",
-                "check --target wasm32-unknown-unknown "
-                "--no-default-features --features wasm-browser-dev",
-            ),
+            "next_wasm_profile_check",
+            "check --target wasm32-unknown-unknown "
+            "--no-default-features --features wasm-browser-dev",
             "Resolve wasm32 compile blockers (for example getrandom wasm_js gating) before Next onboarding.",
             package_entrypoint="@asupersync/next",
             adapter_path="next/app-router",
             runtime_profile="FP-BR-DEV",
             diagnostic_category="profile_closure",
         ),
-        Step(
+        rch_cargo_step(
             "next.bootstrap_state_machine_contract",
-            rch_cargo_command(
-                "next_bootstrap_state_machine_contract",
-                "test --test wasm_abi_contract nextjs_bootstrap_ -- --nocapture",
-            ),
+            "next_bootstrap_state_machine_contract",
+            "test --test wasm_abi_contract nextjs_bootstrap_ -- --nocapture",
             "Fix Next.js bootstrap transition/recovery contract regressions and ensure deterministic log fields.",
             package_entrypoint="@asupersync/next",
             adapter_path="next/app-router",
@@ -489,12 +490,10 @@ SCENARIOS: dict[str, list[Step]] = {
             coverage_kind="behavioral",
             trace_artifact_hint="artifacts/onboarding/next.bootstrap_state_machine_contract.log",
         ),
-        Step(
+        rch_cargo_step(
             "next.behavior_bootstrap_harness",
-            rch_cargo_command(
-                "next_behavior_bootstrap_harness",
-                "test --test nextjs_bootstrap_harness -- --nocapture",
-            ),
+            "next_behavior_bootstrap_harness",
+            "test --test nextjs_bootstrap_harness -- --nocapture",
             "Investigate Next.js hydration/bootstrap behavior regressions in harness tests.",
             package_entrypoint="@asupersync/next",
             adapter_path="next/app-router",
@@ -503,13 +502,11 @@ SCENARIOS: dict[str, list[Step]] = {
             coverage_kind="behavioral",
             trace_artifact_hint="artifacts/onboarding/next.behavior_bootstrap_harness.log",
         ),
-        Step(
+        rch_cargo_step(
             "next.timing_navigation_churn",
-            rch_cargo_command(
-                "next_timing_navigation_churn",
-                "test --test nextjs_bootstrap_harness "
-                "rapid_navigation_churn_with_interleaved_recovery_remains_deterministic -- --nocapture",
-            ),
+            "next_timing_navigation_churn",
+            "test --test nextjs_bootstrap_harness "
+            "rapid_navigation_churn_with_interleaved_recovery_remains_deterministic -- --nocapture",
             "Investigate navigation-churn timing/recovery regressions in Next.js bootstrap state machine.",
             package_entrypoint="@asupersync/next",
             adapter_path="next/app-router",
@@ -518,7 +515,7 @@ SCENARIOS: dict[str, list[Step]] = {
             coverage_kind="lifecycle_chaos",
             trace_artifact_hint="artifacts/onboarding/next.timing_navigation_churn.log",
         ),
-        Step(
+        command_step(
             "next.optimization_policy",
             "python3 scripts/check_wasm_optimization_policy.py "
             "--policy .github/wasm_optimization_policy.json",
@@ -534,17 +531,30 @@ SCENARIOS: dict[str, list[Step]] = {
 }
 
 
-def write_ndjson(path: Path, rows: Iterable[dict]) -> None:
-    with path.open("w", encoding="utf-8") as f:
-        for row in rows:
-            f.write(json.dumps(row, sort_keys=True))
-            f.write("\n")
+# json.dumps builds a fresh encoder on every call once options are passed;
+# reuse one per output shape instead.
+_encode_row = json.JSONEncoder(sort_keys=True).encode
+_encode_summary = json.JSONEncoder(indent=2, sort_keys=True).encode
+
+# Failure excerpts only need the end of the log; read at most this much.
+TAIL_WINDOW_BYTES = 64 * 1024
 
 
 def tail_excerpt(path: Path, max_lines: int = 30) -> str:
-    if not path.exists():
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
         return ""
-    lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+    if size <= TAIL_WINDOW_BYTES:
+        # Early failures usually leave short logs; take them in one read.
+        data = path.read_bytes()
+    else:
+        with path.open("rb") as f:
+            f.seek(size - TAIL_WINDOW_BYTES)
+            data = f.read()
+        # Drop the partial line the window starts in.
+        data = data[data.find(b"\n") + 1 :]
+    lines = data.decode("utf-8", errors="replace").splitlines()
     return "\n".join(lines[-max_lines:])
 
 
@@ -565,9 +575,6 @@ def run_step(
     dry_run: bool,
 ) -> dict:
     log_path = out_dir / f"{step.step_id}.log"
-    started_at = now_iso()
-    t0 = time.perf_counter()
-
     env_metadata = {
         "cwd": str(Path.cwd()),
         "target": "wasm32-unknown-unknown",
@@ -584,8 +591,8 @@ def run_step(
             "correlation_id": f"{scenario_id}:{step_index:02d}:{step.step_id}",
             "command": step.command,
             "repro_command": step.command,
-            "started_at": started_at,
-            "ended_at": started_at,
+            "started_at": _DRY_RUN_TS,
+            "ended_at": _DRY_RUN_TS,
             "duration_ms": 0,
             "exit_code": 0,
             "outcome": "dry_run",
@@ -600,19 +607,27 @@ def run_step(
             "trace_artifact_hint": step.trace_artifact_hint,
         }
 
-    with log_path.open("w", encoding="utf-8") as log_f:
-        proc = subprocess.run(
-            step.command,
-            shell=True,
-            stdout=log_f,
-            stderr=subprocess.STDOUT,
-            text=True,
-            check=False,
-        )
+    started_at = now_iso()
+    t0 = time.perf_counter()
+    env = {**os.environ, **step.env} if step.env else None
+    # The child writes straight to the descriptor; binary mode keeps Python's
+    # text layer out of the way for the one message we may add ourselves.
+    with log_path.open("wb", buffering=64 * 1024) as log_f:
+        try:
+            exit_code = subprocess.run(
+                step.argv,
+                stdout=log_f,
+                stderr=subprocess.STDOUT,
+                env=env,
+                check=False,
+            ).returncode
+        except OSError as exc:
+            # Mirror the shell's "command not found" status.
+            log_f.write(f"failed to execute {step.argv[0]}: {exc}\n".encode("utf-8"))
+            exit_code = 127
 
     duration_ms = int((time.perf_counter() - t0) * 1000)
     ended_at = now_iso()
-    exit_code = proc.returncode
     rch_local_fallback = log_has_rch_local_fallback(log_path)
     rch_local_fallback_marker = ""
     if rch_local_fallback:
@@ -653,47 +668,101 @@ def run_step(
     }
 
 
-def run_scenario(scenario_id: str, out_dir: Path, dry_run: bool) -> int:
+def run_scenario(scenario_id: str, out_dir: Path, dry_run: bool) -> dict:
     steps = SCENARIOS[scenario_id]
-    rows: list[dict] = []
+    correlation_ids: list[str] = []
+    failed_steps: list[str] = []
     scenario_status = "pass"
 
-    for index, step in enumerate(steps):
-        row = run_step(
-            scenario_id=scenario_id,
-            step_index=index,
-            step=step,
-            out_dir=out_dir,
-            dry_run=dry_run,
-        )
-        rows.append(row)
-        if row["outcome"] == "fail":
-            scenario_status = "fail"
-            # Preserve deterministic partial artifact set and stop early.
-            break
-
     suffix = ".dry_run" if dry_run else ""
     ndjson_path = out_dir / f"{scenario_id}{suffix}.ndjson"
     summary_path = out_dir / f"{scenario_id}{suffix}.summary.json"
-    write_ndjson(ndjson_path, rows)
+
+    # Rows are written as each step finishes so a killed run still leaves
+    # the completed steps on disk.
+    with ndjson_path.open("w", encoding="utf-8", buffering=1) as ndjson_f:
+        for index, step in enumerate(steps):
+            row = run_step(
+                scenario_id=scenario_id,
+                step_index=index,
+                step=step,
+                out_dir=out_dir,
+                dry_run=dry_run,
+            )
+            ndjson_f.write(_encode_row(row) + "\n")
+            correlation_ids.append(row["correlation_id"])
+            if row["outcome"] == "fail":
+                scenario_status = "fail"
+                failed_steps.append(row["step_id"])
+                # Preserve deterministic partial artifact set and stop early.
+                break
 
     summary = {
         "schema": "asupersync-onboarding-summary-v1",
         "scenario_id": scenario_id,
         "status": scenario_status if not dry_run else "dry_run",
-        "step_count": len(rows),
-        "failed_steps": [r["step_id"] for r in rows if r["outcome"] == "fail"],
-        "ordered_correlation_ids": [r["correlation_id"] for r in rows],
+        "step_count": len(correlation_ids),
+        "failed_steps": failed_steps,
+        "ordered_correlation_ids": correlation_ids,
         "ndjson_path": str(ndjson_path),
-        "generated_at": now_iso(),
+        "generated_at": _DRY_RUN_TS if dry_run else now_iso(),
     }
-    summary_path.write_text(json.dumps(summary, indent=2, sort_keys=True), encoding="utf-8")
-
-    print(
-        f"[onboarding] scenario={scenario_id} status={summary['status']} "
-        f"steps={summary['step_count']} ndjson={ndjson_path}"
-    )
-    return 0 if summary["status"] in {"pass", "dry_run"} else 1
+    summary_path.write_text(_encode_summary(summary), encoding="utf-8")
+    return summary
+
+
+def iter_scenario_summaries(
+    scenarios: list[str], out_dir: Path, dry_run: bool, jobs: int
+) -> Iterator[dict]:
+    """Run scenarios and yield each summary as its scenario finishes.
+
+    jobs == 1 runs them serially in order. Otherwise scenarios share a thread
+    pool: they write disjoint artifacts and mostly wait on subprocesses. If
+    one raises, scenarios that have not started yet are cancelled before the
+    error propagates.
+    """
+    if jobs == 1:
+        for scenario_id in scenarios:
+            yield run_scenario(scenario_id, out_dir, dry_run)
+        return
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(run_scenario, scenario_id, out_dir, dry_run)
+            for scenario_id in scenarios
+        ]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        except BaseException:
+            pool.shutdown(cancel_futures=True)
+            raise
+
+
+def run_self_test() -> None:
+    for steps in SCENARIOS.values():
+        for step in steps:
+            assert step.argv, f"{step.step_id} has no argv"
+            assert "$" not in " ".join(step.argv), f"{step.step_id} argv left unexpanded"
+
+    cargo = rch_cargo_step("t.cargo", "t_cargo", "test --lib -- --nocapture", "hint")
+    assert cargo.command == (
+        'rch exec -- env CARGO_TARGET_DIR="${TMPDIR:-/tmp}/rch_target_browser_onboarding_t_cargo" '
+        "cargo test --lib -- --nocapture"
+    ), cargo.command
+    assert cargo.argv[:4] == ("rch", "exec", "--", "env"), cargo.argv
+    assert cargo.argv[4].startswith("CARGO_TARGET_DIR=/"), cargo.argv
+    assert cargo.argv[4].endswith("/rch_target_browser_onboarding_t_cargo"), cargo.argv
+    assert cargo.argv[5:] == ("cargo", "test", "--lib", "--", "--nocapture"), cargo.argv
+
+    script = consumer_script_step("t.script", "scripts/x.sh", "hint")
+    assert script.command == "PATH=/usr/bin:$PATH bash scripts/x.sh", script.command
+    assert script.argv == ("bash", "scripts/x.sh"), script.argv
+    assert script.env is not None and script.env["PATH"].startswith("/usr/bin:"), script.env
+
+    plain = command_step("t.plain", "python3 scripts/x.py --flag value", "hint")
+    assert plain.argv == ("python3", "scripts/x.py", "--flag", "value"), plain.argv
+    assert plain.env is None
 
 
 def parse_args() -> argparse.Namespace:
@@ -714,11 +783,30 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Emit artifacts without executing commands.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--self-test",
+        action="store_true",
+        help="Run script self-tests and exit.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Scenarios to run concurrently (default: 1, i.e. serially).",
+    )
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be >= 1")
+    return args
 
 
 def main() -> int:
     args = parse_args()
+    if args.self_test:
+        run_self_test()
+        print("browser onboarding checks self-test passed")
+        return 0
+
     out_dir = Path(args.out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -729,13 +817,14 @@ def main() -> int:
     )
 
     exit_code = 0
-    for scenario_id in scenarios:
-        scenario_exit = run_scenario(
-            scenario_id=scenario_id,
-            out_dir=out_dir,
-            dry_run=args.dry_run,
+    for summary in iter_scenario_summaries(scenarios, out_dir, args.dry_run, args.jobs):
+        print(
+            f"[onboarding] scenario={summary['scenario_id']} status={summary['status']} "
+            f"steps={summary['step_count']} ndjson={summary['ndjson_path']}",
+            flush=True,
         )
-        exit_code = max(exit_code, scenario_exit)
+        if summary["status"] not in {"pass", "dry_run"}:
+            exit_code = 1
 
     return exit_code
 